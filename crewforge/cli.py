@@ -1,19 +1,97 @@
 """CLI interface for CrewForge."""
 
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-import yaml
 
-from .core import CrewForgeOrchestrator
-from .storage import get_database, ProjectStatus, TaskStatus
-from .config import get_settings
+# Heavy dependencies (CrewAI orchestration, SQLAlchemy storage, PyYAML and the
+# larger Rich widgets) are imported inside the commands that need them so that
+# `crewforge --help` / `--version` stay fast.
+
+
+def _yaml_load(stream):
+    """Load YAML with the libyaml-backed safe loader when available."""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml.load(stream, Loader=Loader)
+
+
+def _yaml_dump(data, stream) -> None:
+    """Dump YAML with the libyaml-backed safe dumper when available."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    yaml.dump(
+        data, stream, Dumper=Dumper,
+        default_flow_style=False, sort_keys=False, allow_unicode=True,
+    )
+
+
+def _read_project_name(config_path: Path) -> Optional[str]:
+    """Read project.name from crewforge.yaml, parsing only the `project:` block.
+
+    Falls back to parsing the whole file if the block is not found at top level.
+    """
+    header = []
+    with open(config_path, encoding="utf-8") as f:
+        for line in f:
+            if header:
+                if line.strip() and not line[0].isspace() and not line.startswith("#"):
+                    break
+                header.append(line)
+            elif line.startswith("project:"):
+                header.append(line)
+
+    if header:
+        data = _yaml_load("".join(header))
+        name = (data.get("project") or {}).get("name") if isinstance(data, dict) else None
+        if name:
+            return str(name)
+
+    with open(config_path, encoding="utf-8") as f:
+        data = _yaml_load(f) or {}
+    return (data.get("project") or {}).get("name")
+
+
+def _format_timestamp(value, default: str = "") -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without microseconds."""
+    return value.isoformat(sep=" ", timespec="seconds") if value else default
+
+
+# 显示颜色映射，按状态枚举的 value 索引，避免在模块导入时加载存储层
+_PROJECT_STATUS_COLORS = {
+    "completed": "green",
+    "failed": "red",
+    "developing": "blue",
+    "testing": "cyan",
+}
+
+_TASK_STATUS_STYLES = {
+    "completed": "green",
+    "failed": "red",
+    "in_progress": "blue",
+    "pending": "yellow",
+    "retrying": "magenta",
+}
+
+_LEVEL_COLORS = {
+    "DEBUG": "dim",
+    "INFO": "blue",
+    "WARNING": "yellow",
+    "ERROR": "red",
+}
+
 
 app = typer.Typer(
     name="crewforge",
@@ -48,9 +126,12 @@ def init(
     template: Optional[str] = typer.Option(None, "--template", "-t", help="项目模板"),
 ):
     """初始化新的 CrewForge 项目"""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
     project_path = Path(path) if path else Path.cwd() / name
 
-    if project_path.exists() and any(project_path.iterdir()):
+    if project_path.exists() and next(project_path.iterdir(), None) is not None:
         if not Confirm.ask(f"[yellow]目录 {project_path} 不为空。是否继续？[/]"):
             raise typer.Exit(1)
 
@@ -82,7 +163,7 @@ def init(
 
     config_path = project_path / "crewforge.yaml"
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        _yaml_dump(config, f)
 
     console.print(Panel(
         f"[green]项目初始化成功！[/]\n\n"
@@ -106,6 +187,11 @@ def run(
     verbose: bool = typer.Option(False, "--verbose", "-V", help="启用详细输出"),
 ):
     """启动开发流程"""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    from .core import CrewForgeOrchestrator
+
     # 查找配置文件
     config_path = Path(config) if config else Path.cwd() / "crewforge.yaml"
 
@@ -113,11 +199,8 @@ def run(
         console.print("[red]错误: 未找到 crewforge.yaml。请先运行 'crewforge init'。[/]")
         raise typer.Exit(1)
 
-    # 加载配置
-    with open(config_path) as f:
-        project_config = yaml.safe_load(f)
-
-    project_name = project_config.get("project", {}).get("name", "未命名")
+    # 加载配置（只需要 project.name）
+    project_name = _read_project_name(config_path) or "未命名"
 
     # 获取需求
     if requirements:
@@ -129,25 +212,29 @@ def run(
         console.print(Panel(
             "[bold]输入您的项目需求[/]\n"
             "描述您想要构建的内容。请尽可能详细。\n"
-            "连续按两次回车完成输入。",
+            "输入完成后按 Ctrl-D（Windows 上为 Ctrl-Z 后回车）结束。",
             title="需求输入"
         ))
-        lines = []
-        while True:
-            line = Prompt.ask("", default="")
-            if line == "" and lines and lines[-1] == "":
-                break
-            lines.append(line)
-        req_content = "\n".join(lines[:-1])  # 移除最后一个空行
+        # 一次性读取全部输入，支持直接粘贴多段文本或通过管道传入
+        req_content = sys.stdin.read()
 
     if not req_content.strip():
         console.print("[red]错误: 需求不能为空。[/]")
         raise typer.Exit(1)
 
+    # stdin 不是终端时（例如需求通过管道传入），审批改从控制终端读取
+    approval_stream = None
+    if not sys.stdin.isatty():
+        try:
+            approval_stream = open("CON" if os.name == "nt" else "/dev/tty", encoding="utf-8")
+        except OSError:
+            console.print("[red]错误: 标准输入不是终端，且无法打开终端进行审批确认。[/]")
+            raise typer.Exit(1)
+
     # 创建 CLI 审批回调
     def cli_approval(approval_type: str, content: str) -> bool:
         console.print(Panel(content, title=f"[bold]{approval_type}[/]"))
-        return Confirm.ask("[bold yellow]是否批准？[/]")
+        return Confirm.ask("[bold yellow]是否批准？[/]", stream=approval_stream)
 
     # 初始化并运行编排器
     orchestrator = CrewForgeOrchestrator(
@@ -157,7 +244,11 @@ def run(
         on_approval_needed=cli_approval,
     )
 
-    results = orchestrator.run(req_content)
+    try:
+        results = orchestrator.run(req_content)
+    finally:
+        if approval_stream is not None:
+            approval_stream.close()
 
     # 显示结果
     if results["status"] == "completed":
@@ -181,6 +272,12 @@ def resume(
     verbose: bool = typer.Option(False, "--verbose", "-V", help="启用详细输出"),
 ):
     """恢复之前中断的项目"""
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from .core import CrewForgeOrchestrator
+    from .storage import get_database
+
     db = get_database()
 
     if project:
@@ -190,7 +287,7 @@ def resume(
             raise typer.Exit(1)
     else:
         # 列出项目并让用户选择
-        projects = db.list_projects()
+        projects = db.list_project_summaries()
         if not projects:
             console.print("[yellow]未找到项目。[/]")
             raise typer.Exit(0)
@@ -206,7 +303,7 @@ def resume(
                 str(p.id),
                 p.name,
                 p.status.value if p.status else "未知",
-                str(p.created_at)[:19] if p.created_at else "",
+                _format_timestamp(p.created_at),
             )
 
         console.print(table)
@@ -238,6 +335,11 @@ def status(
     project: Optional[str] = typer.Option(None, "--project", "-p", help="项目名称"),
 ):
     """显示项目状态"""
+    from rich.console import Group
+    from rich.table import Table
+
+    from .storage import TaskStatus, get_database
+
     db = get_database()
 
     if project:
@@ -247,28 +349,26 @@ def status(
             raise typer.Exit(1)
         projects = [proj]
     else:
-        projects = db.list_projects()
+        projects = db.list_project_summaries()
 
     if not projects:
         console.print("[yellow]未找到项目。[/]")
         return
 
+    status_counts = db.get_task_status_counts([p.id for p in projects])
+    renderables = []
+
     for proj in projects:
-        tasks = db.get_project_tasks(proj.id)
+        counts = status_counts[proj.id]
 
-        completed = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-        pending = len([t for t in tasks if t.status == TaskStatus.PENDING])
-        failed = len([t for t in tasks if t.status == TaskStatus.FAILED])
-        in_progress = len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS])
+        completed = counts.get(TaskStatus.COMPLETED, 0)
+        pending = counts.get(TaskStatus.PENDING, 0)
+        failed = counts.get(TaskStatus.FAILED, 0)
+        in_progress = counts.get(TaskStatus.IN_PROGRESS, 0)
 
         # 状态颜色
-        status_colors = {
-            ProjectStatus.COMPLETED: "green",
-            ProjectStatus.FAILED: "red",
-            ProjectStatus.DEVELOPING: "blue",
-            ProjectStatus.TESTING: "cyan",
-        }
-        status_color = status_colors.get(proj.status, "yellow")
+        status_value = proj.status.value if proj.status else None
+        status_color = _PROJECT_STATUS_COLORS.get(status_value, "yellow")
 
         table = Table(title=f"项目: {proj.name}")
         table.add_column("属性", style="bold")
@@ -276,16 +376,18 @@ def status(
 
         table.add_row("状态", f"[{status_color}]{proj.status.value if proj.status else '未知'}[/]")
         table.add_row("路径", proj.git_repo_path or "N/A")
-        table.add_row("创建时间", str(proj.created_at)[:19] if proj.created_at else "N/A")
+        table.add_row("创建时间", _format_timestamp(proj.created_at, "N/A"))
         table.add_row("", "")
-        table.add_row("任务总数", str(len(tasks)))
+        table.add_row("任务总数", str(sum(counts.values())))
         table.add_row("  已完成", f"[green]{completed}[/]")
         table.add_row("  进行中", f"[blue]{in_progress}[/]")
         table.add_row("  等待中", f"[yellow]{pending}[/]")
         table.add_row("  失败", f"[red]{failed}[/]")
 
-        console.print(table)
-        console.print("")
+        renderables.append(table)
+        renderables.append("")
+
+    console.print(Group(*renderables))
 
 
 @app.command()
@@ -293,6 +395,11 @@ def tasks(
     project: str = typer.Option(..., "--project", "-p", help="项目名称"),
 ):
     """列出项目的任务列表"""
+    from rich.table import Table
+    from rich.text import Text
+
+    from .storage import get_database
+
     db = get_database()
 
     proj = db.get_project_by_name(project)
@@ -313,19 +420,11 @@ def tasks(
     table.add_column("状态", style="yellow")
     table.add_column("重试次数", style="dim", width=7)
 
-    status_styles = {
-        TaskStatus.COMPLETED: "green",
-        TaskStatus.FAILED: "red",
-        TaskStatus.IN_PROGRESS: "blue",
-        TaskStatus.PENDING: "yellow",
-        TaskStatus.RETRYING: "magenta",
-    }
-
     for task in task_list:
-        style = status_styles.get(task.status, "white")
+        style = _TASK_STATUS_STYLES.get(task.status.value, "white")
         table.add_row(
             str(task.id),
-            task.title[:40] + "..." if len(task.title) > 40 else task.title,
+            Text(task.title, overflow="ellipsis", no_wrap=True),
             task.assigned_agent or "未分配",
             f"[{style}]{task.status.value}[/]",
             str(task.retry_count),
@@ -341,6 +440,11 @@ def logs(
     level: Optional[str] = typer.Option(None, "--level", "-l", help="按日志级别筛选"),
 ):
     """显示智能体日志"""
+    from rich.console import Group
+    from rich.text import Text
+
+    from .storage import get_database
+
     db = get_database()
 
     proj = db.get_project_by_name(project)
@@ -350,34 +454,29 @@ def logs(
 
     if task_id:
         logs_list = db.get_task_logs(task_id)
+        if level:
+            logs_list = [log for log in logs_list if log.level == level.upper()]
+        logs_list.sort(key=lambda x: x.created_at)
     else:
-        # 获取所有任务及其日志
-        tasks = db.get_project_tasks(proj.id)
-        logs_list = []
-        for task in tasks:
-            logs_list.extend(db.get_task_logs(task.id))
-
-    if level:
-        logs_list = [log for log in logs_list if log.level == level.upper()]
+        # 一次查询获取项目所有任务的日志（已按时间排序）
+        logs_list = db.get_project_logs(proj.id, level=level.upper() if level else None)
 
     if not logs_list:
         console.print("[yellow]未找到日志。[/]")
         return
 
-    level_colors = {
-        "DEBUG": "dim",
-        "INFO": "blue",
-        "WARNING": "yellow",
-        "ERROR": "red",
-    }
+    # 构建全部日志行后一次性渲染，避免逐行 console.print
+    lines = []
+    for log in logs_list:
+        timestamp = _format_timestamp(log.created_at)
+        line = Text()
+        line.append(f"{timestamp} ", style="dim")
+        line.append(f"{log.level:7} ", style=_LEVEL_COLORS.get(log.level, "white"))
+        line.append(log.agent_role, style="cyan")
+        line.append(f" - {log.action}: {log.message or ''}")
+        lines.append(line)
 
-    for log in sorted(logs_list, key=lambda x: x.created_at):
-        color = level_colors.get(log.level, "white")
-        timestamp = str(log.created_at)[:19] if log.created_at else ""
-        console.print(
-            f"[dim]{timestamp}[/] [{color}]{log.level:7}[/] "
-            f"[cyan]{log.agent_role}[/] - {log.action}: {log.message or ''}"
-        )
+    console.print(Group(*lines), highlight=False)
 
 
 @app.command()
@@ -386,6 +485,9 @@ def config(
     edit: bool = typer.Option(False, "--edit", "-e", help="编辑配置"),
 ):
     """管理配置文件"""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     config_path = Path.cwd() / "crewforge.yaml"
 
     if show:
@@ -402,11 +504,16 @@ def config(
             console.print("[yellow]未找到 crewforge.yaml。请先运行 'crewforge init'。[/]")
             return
 
+        import shlex
         import subprocess
-        import os
 
-        editor = os.environ.get("EDITOR", "vim")
-        subprocess.run([editor, str(config_path)])
+        # $EDITOR 可能带参数（如 "code --wait"），需拆分后直接执行，不经过 shell
+        editor = shlex.split(os.environ.get("EDITOR") or "vim", posix=os.name != "nt")
+        try:
+            subprocess.run([*editor, str(config_path)], check=False)
+        except FileNotFoundError:
+            console.print(f"[red]未找到编辑器 '{editor[0]}'，请检查 $EDITOR。[/]")
+            raise typer.Exit(1)
         console.print("[green]配置已更新。[/]")
 
     else:
@@ -417,8 +524,12 @@ def config(
 @app.command(name="list")
 def list_projects():
     """列出所有项目"""
+    from rich.table import Table
+
+    from .storage import get_database
+
     db = get_database()
-    projects = db.list_projects()
+    projects = db.list_project_summaries()
 
     if not projects:
         console.print("[yellow]未找到项目。[/]")
@@ -441,7 +552,7 @@ def list_projects():
             p.name,
             p.status.value if p.status else "未知",
             path,
-            str(p.created_at)[:10] if p.created_at else "",
+            p.created_at.date().isoformat() if p.created_at else "",
         )
 
     console.print(table)
@@ -454,6 +565,10 @@ def clean(
     force: bool = typer.Option(False, "--force", "-f", help="跳过确认"),
 ):
     """从数据库清理项目数据"""
+    from rich.prompt import Confirm
+
+    from .storage import get_database
+
     if not project and not all_projects:
         console.print("[yellow]请指定 --project 或 --all。[/]")
         return
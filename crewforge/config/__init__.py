@@ -1,7 +1,17 @@
 """Configuration module."""
 
-from .settings import Settings, get_settings
-from .llm import LLMConfig, get_llm_config, LLMProvider, AgentRole
+import importlib
+
+# Re-exports are resolved lazily (PEP 562) so `import crewforge.config` stays cheap;
+# pydantic-settings and the submodules load only when an attribute is first used.
+_LAZY_IMPORTS = {
+    "Settings": ".settings",
+    "get_settings": ".settings",
+    "LLMConfig": ".llm",
+    "get_llm_config": ".llm",
+    "LLMProvider": ".llm",
+    "AgentRole": ".llm",
+}
 
 __all__ = [
     "Settings",
@@ -11,3 +21,16 @@ __all__ = [
     "LLMProvider",
     "AgentRole",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
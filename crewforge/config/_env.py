@@ -0,0 +1,37 @@
+"""Shared .env loading for the settings classes."""
+
+import os
+from functools import lru_cache
+
+from dotenv import dotenv_values
+from pydantic_settings import BaseSettings
+
+
+@lru_cache
+def load_dotenv_values(path: str = ".env") -> dict[str, str]:
+    """Parse a .env file once per process."""
+    return {key: value for key, value in dotenv_values(path).items() if value is not None}
+
+
+def dotenv_kwargs(settings_cls: type[BaseSettings], path: str = ".env") -> dict[str, str]:
+    """Map the .env entries that belong to ``settings_cls`` to init kwargs.
+
+    Keys are matched case-insensitively against the class's env prefix and field
+    aliases, like pydantic-settings does. Variables already set in the process
+    environment are skipped so they keep precedence over the file.
+    """
+    prefix = settings_cls.model_config.get("env_prefix", "").lower()
+    names = {}
+    for field_name, field in settings_cls.model_fields.items():
+        if field.alias:
+            names[field.alias.lower()] = field.alias
+        else:
+            names[f"{prefix}{field_name}"] = field_name
+
+    environ = {key.lower() for key in os.environ}
+    kwargs = {}
+    for key, value in load_dotenv_values(path).items():
+        lowered = key.lower()
+        if lowered in names and lowered not in environ:
+            kwargs[names[lowered]] = value
+    return kwargs
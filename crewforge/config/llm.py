@@ -1,12 +1,13 @@
 """LLM configuration with tiered model support."""
 
 from enum import Enum
-from functools import lru_cache
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ._env import dotenv_kwargs
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -28,6 +29,12 @@ class AgentRole(str, Enum):
     DEVOPS = "devops"
 
 
+# Roles served by the strategic model tier; all other roles use the execution tier.
+_STRATEGIC_ROLES: frozenset[AgentRole] = frozenset(
+    {AgentRole.MANAGER, AgentRole.ARCHITECT, AgentRole.REVIEWER}
+)
+
+
 class TierConfig(BaseModel):
     """Configuration for a model tier."""
 
@@ -50,6 +57,7 @@ class LLMConfig(BaseSettings):
     # API Keys
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
     anthropic_api_key: str | None = Field(default=None, alias="ANTHROPIC_API_KEY")
+    openrouter_api_key: str | None = Field(default=None, alias="OPENROUTER_API_KEY")
 
     # OpenAI settings (custom base URL for proxies or compatible APIs)
     openai_base_url: str | None = Field(default=None, alias="OPENAI_BASE_URL")
@@ -79,18 +87,51 @@ class LLMConfig(BaseSettings):
     temperature: float = 0.7
     max_tokens: int = 4096
 
+    # Final (provider-prefixed) model name per role, built once in model_post_init.
+    # The config is treated as immutable after construction.
+    _role_models: dict[AgentRole, str] = PrivateAttr(default_factory=dict)
+    # Same, with any prefix LiteLLM needs on top (see resolve_model).
+    _resolved_models: dict[AgentRole, str] = PrivateAttr(default_factory=dict)
+    _provider_config: dict = PrivateAttr(default_factory=dict)
+    _is_openrouter: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the model name for every role and the provider config."""
+        self._is_openrouter = bool(
+            self.openai_compatible_base_url and "openrouter" in self.openai_compatible_base_url
+        )
+        self._role_models = {
+            role: self._format_model(
+                self.strategic_model if role in _STRATEGIC_ROLES else self.execution_model
+            )
+            for role in AgentRole
+        }
+        self._resolved_models = {
+            role: self.resolve_model(model) for role, model in self._role_models.items()
+        }
+        self._provider_config = self._build_provider_config()
+
     def get_model_for_role(self, role: AgentRole) -> str:
         """Get the appropriate model for a given agent role."""
-        strategic_roles = {AgentRole.MANAGER, AgentRole.ARCHITECT, AgentRole.REVIEWER}
-        if role in strategic_roles:
-            model = self.strategic_model
-        else:
-            model = self.execution_model
+        return self._role_models[role]
+
+    def resolved_model_for(self, role: AgentRole) -> str:
+        """Get the model name to hand to the LLM client for a given agent role."""
+        return self._resolved_models[role]
+
+    def resolve_model(self, model: str) -> str:
+        """Get the model name to hand to the LLM client for an explicit model."""
+        if self.provider == LLMProvider.OPENAI and self.openai_base_url:
+            # Force openai provider to avoid LiteLLM auto-detecting based on model name
+            # This prevents it from trying to use anthropic SDK for claude models
+            return f"openai/{model}"
+        return model
 
-        # Format model string for LiteLLM based on provider
+    def _format_model(self, model: str) -> str:
+        """Format a model string for LiteLLM based on the provider."""
         if self.provider == LLMProvider.OPENAI_COMPATIBLE:
             # For OpenRouter, use openrouter/ prefix
-            if self.openai_compatible_base_url and "openrouter" in self.openai_compatible_base_url:
+            if self._is_openrouter:
                 return f"openrouter/{model}"
             # For other compatible APIs, return model as-is
             return model
@@ -112,6 +153,10 @@ class LLMConfig(BaseSettings):
 
     def get_provider_config(self) -> dict:
         """Get provider-specific configuration."""
+        # Copy so callers can't mutate the cached dict
+        return dict(self._provider_config)
+
+    def _build_provider_config(self) -> dict:
         if self.provider == LLMProvider.OPENAI:
             config = {"api_key": self.openai_api_key}
             if self.openai_base_url:
@@ -134,7 +179,12 @@ class LLMConfig(BaseSettings):
         return {}
 
 
-@lru_cache
+_llm_config: LLMConfig | None = None
+
+
 def get_llm_config() -> LLMConfig:
     """Get cached LLM configuration."""
-    return LLMConfig()
+    global _llm_config
+    if _llm_config is None:
+        _llm_config = LLMConfig(_env_file=None, **dotenv_kwargs(LLMConfig))
+    return _llm_config
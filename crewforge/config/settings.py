@@ -1,12 +1,13 @@
 """Global settings configuration."""
 
-from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ._env import dotenv_kwargs
+
 
 class Settings(BaseSettings):
     """Global application settings."""
@@ -47,7 +48,12 @@ class Settings(BaseSettings):
     openspec_auto_update: bool = True  # Auto update specs when implementation deviates
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings(_env_file=None, **dotenv_kwargs(Settings))
+    return _settings
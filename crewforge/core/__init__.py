@@ -1,6 +1,25 @@
 """Core module for CrewAI orchestration."""
 
-from .crew import CrewForgeOrchestrator
-from .manager import ManagerAgent
+import importlib
+
+# Re-exports are resolved lazily (PEP 562) so importing the package does not
+# pull in crewai until an orchestrator or agent is actually needed.
+_LAZY_IMPORTS = {
+    "CrewForgeOrchestrator": ".crew",
+    "ManagerAgent": ".manager",
+}
 
 __all__ = ["CrewForgeOrchestrator", "ManagerAgent"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,17 @@
 """Agent definitions for CrewForge."""
 
-from .base import BaseCrewForgeAgent
-from .architect import ArchitectAgent
-from .developer import DeveloperAgent
-from .reviewer import ReviewerAgent
-from .tester import TesterAgent
-from .devops import DevOpsAgent
+import importlib
+
+# Re-exports are resolved lazily (PEP 562) so importing one agent module does
+# not import all of them.
+_LAZY_IMPORTS = {
+    "BaseCrewForgeAgent": ".base",
+    "ArchitectAgent": ".architect",
+    "DeveloperAgent": ".developer",
+    "ReviewerAgent": ".reviewer",
+    "TesterAgent": ".tester",
+    "DevOpsAgent": ".devops",
+}
 
 __all__ = [
     "BaseCrewForgeAgent",
@@ -15,3 +21,16 @@ __all__ = [
     "TesterAgent",
     "DevOpsAgent",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,24 @@
 """Architect agent for system design and technical decisions."""
 
-from crewai import Agent
-
 from ...config import AgentRole
 from ...tools import FileSystemTool, ShellExecutorTool, WebSearchTool, get_openspec_tools
-from .base import BaseCrewForgeAgent
+from .base import BaseCrewForgeAgent, clean_prompt
 
 
 class ArchitectAgent(BaseCrewForgeAgent):
     """Architect agent responsible for system design and technical architecture."""
 
+    __slots__ = ()
+
     role = AgentRole.ARCHITECT
     name = "Software Architect"
-    goal = """Design robust, scalable, and maintainable software architectures.
+    max_iter = 10
+    goal = clean_prompt("""Design robust, scalable, and maintainable software architectures.
     Make informed technical decisions about technology stack, design patterns,
     and system structure. Create clear OpenSpec documentation (SPEC.md and PLAN.md)
-    that developers can follow."""
+    that developers can follow.""")
 
-    backstory = """You are a seasoned software architect with 15+ years of experience
+    backstory = clean_prompt("""You are a seasoned software architect with 15+ years of experience
     across multiple technology domains. You have designed systems ranging from
     small microservices to large-scale distributed platforms. You deeply understand
     design patterns, SOLID principles, and modern architectural paradigms including
@@ -36,27 +37,13 @@ class ArchitectAgent(BaseCrewForgeAgent):
     - PLAN.md: Details implementation strategy, architecture, and "how" to build
 
     You produce clear, actionable OpenSpec documentation that serves as living
-    documentation throughout the project lifecycle."""
+    documentation throughout the project lifecycle.""")
 
-    def get_tools(self) -> list:
-        """Get architect-specific tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build architect-specific tools."""
+        tools = cls.get_base_tools()
         tools.append(WebSearchTool())
         # Add OpenSpec tools for spec-driven development
         tools.extend(get_openspec_tools())
         return tools
-
-    def create_agent(self) -> Agent:
-        """Create the architect agent with specific configuration."""
-        if self._agent is None:
-            self._agent = Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=self.get_tools(),
-                verbose=self.verbose,
-                allow_delegation=False,
-                llm=self.get_llm(),
-                max_iter=10,
-            )
-        return self._agent
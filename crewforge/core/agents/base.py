@@ -1,22 +1,101 @@
 """Base agent class for all CrewForge agents."""
 
-import os
-from abc import ABC, abstractmethod
-from typing import Optional, Any
+import inspect
+import sys
+from typing import Callable, Optional, Any
 
 from crewai import Agent, LLM
 
 from ...config import get_llm_config, AgentRole, LLMProvider
-from ...tools import FileSystemTool, ShellExecutorTool, GitTool
+from ...config.llm import LLMConfig
+from ...tools import FileSystemTool, ShellExecutorTool
 
 
-class BaseCrewForgeAgent(ABC):
+def _build_openai_compatible_llm(llm_config: LLMConfig, model: str) -> LLM:
+    # For OpenRouter or other OpenAI-compatible APIs
+    return LLM(
+        model=model,
+        base_url=llm_config.openai_compatible_base_url,
+        api_key=llm_config.openai_compatible_api_key or llm_config.openrouter_api_key,
+    )
+
+
+def _build_anthropic_llm(llm_config: LLMConfig, model: str) -> LLM:
+    kwargs: dict[str, Any] = {
+        "model": model,  # get_model_for_role adds anthropic/ prefix unless base_url is set
+        "api_key": llm_config.anthropic_api_key,
+        "temperature": llm_config.temperature,
+        "max_tokens": llm_config.max_tokens,
+    }
+    # Support custom base_url for Anthropic proxies
+    if llm_config.anthropic_base_url:
+        kwargs["base_url"] = llm_config.anthropic_base_url
+    return LLM(**kwargs)
+
+
+def _build_ollama_llm(llm_config: LLMConfig, model: str) -> LLM:
+    return LLM(
+        model=model,  # get_model_for_role adds ollama/ prefix
+        base_url=llm_config.ollama_base_url,
+    )
+
+
+def _build_openai_llm(llm_config: LLMConfig, model: str) -> LLM:
+    kwargs: dict[str, Any] = {"model": model, "api_key": llm_config.openai_api_key}
+    # OpenAI - support custom base_url (resolve_model adds the openai/ prefix)
+    if llm_config.openai_base_url:
+        kwargs["base_url"] = llm_config.openai_base_url
+    return LLM(**kwargs)
+
+
+_PROVIDER_BUILDERS: dict[LLMProvider, Callable[[LLMConfig, str], LLM]] = {
+    LLMProvider.OPENAI_COMPATIBLE: _build_openai_compatible_llm,
+    LLMProvider.ANTHROPIC: _build_anthropic_llm,
+    LLMProvider.OLLAMA: _build_ollama_llm,
+    LLMProvider.OPENAI: _build_openai_llm,
+}
+
+
+def build_llm(llm_config: LLMConfig, model: str) -> LLM:
+    """Construct the LLM client for a resolved model name."""
+    return _PROVIDER_BUILDERS[llm_config.provider](llm_config, model)
+
+
+def clean_prompt(text: str) -> str:
+    """Strip source indentation from a class-level prompt string and intern it.
+
+    Goals and backstories are sent to the LLM verbatim, so the leading
+    whitespace left by triple-quoted literals would only cost tokens.
+    """
+    return sys.intern(inspect.cleandoc(text))
+
+
+# The base tools hold no per-agent state, so one set of instances is shared by
+# every agent; callers get their own list so they can extend it freely.
+_BASE_TOOLS_CACHE: Optional[list] = None
+
+
+def _get_base_tools_cached() -> list:
+    global _BASE_TOOLS_CACHE
+    if _BASE_TOOLS_CACHE is None:
+        _BASE_TOOLS_CACHE = [
+            *FileSystemTool.get_tools(),
+            ShellExecutorTool(),
+        ]
+    return _BASE_TOOLS_CACHE
+
+
+class BaseCrewForgeAgent:
     """Base class for all CrewForge agents."""
 
+    __slots__ = ("project_path", "verbose", "_model", "_agent", "_cached_model", "_cached_llm")
+
     role: AgentRole
     name: str
     goal: str
     backstory: str
+    # Iteration cap passed to the CrewAI agent; None keeps the CrewAI default.
+    max_iter: Optional[int] = None
 
     def __init__(
         self,
@@ -35,88 +114,60 @@ class BaseCrewForgeAgent(ABC):
         self.verbose = verbose
         self._model = model
         self._agent: Optional[Agent] = None
+        self._cached_model: Optional[str] = None
+        self._cached_llm: Optional[Any] = None
 
     def get_llm(self) -> Any:
         """Get the LLM instance for this agent."""
-        llm_config = get_llm_config()
+        if self._cached_llm is None:
+            self._cached_llm = self._build_llm()
+        return self._cached_llm
 
-        # get_model_for_role already handles provider prefixes
+    def _build_llm(self) -> Any:
+        """Construct the LLM instance from the current configuration."""
+        llm_config = get_llm_config()
         if self._model:
-            model = self._model
+            model = llm_config.resolve_model(self._model)
         else:
-            model = llm_config.get_model_for_role(self.role)
-
-        # For OpenRouter or other OpenAI-compatible APIs
-        if llm_config.provider == LLMProvider.OPENAI_COMPATIBLE:
-            api_key = llm_config.openai_compatible_api_key or os.getenv("OPENROUTER_API_KEY")
-            base_url = llm_config.openai_compatible_base_url
-
-            return LLM(
-                model=model,
-                base_url=base_url,
-                api_key=api_key,
-            )
-        elif llm_config.provider == LLMProvider.ANTHROPIC:
-            # Support custom base_url for Anthropic proxies
-            if llm_config.anthropic_base_url:
-                return LLM(
-                    model=model,  # No prefix for custom endpoints
-                    base_url=llm_config.anthropic_base_url,
-                    api_key=llm_config.anthropic_api_key,
-                    temperature=llm_config.temperature,
-                    max_tokens=llm_config.max_tokens,
-                )
-            else:
-                return LLM(
-                    model=model,  # get_model_for_role adds anthropic/ prefix
-                    api_key=llm_config.anthropic_api_key,
-                    temperature=llm_config.temperature,
-                    max_tokens=llm_config.max_tokens,
-                )
-        elif llm_config.provider == LLMProvider.OLLAMA:
-            return LLM(
-                model=model,  # get_model_for_role adds ollama/ prefix
-                base_url=llm_config.ollama_base_url,
-            )
-        else:
-            # OpenAI - support custom base_url
-            if llm_config.openai_base_url:
-                # Force openai provider to avoid LiteLLM auto-detecting based on model name
-                # This prevents it from trying to use anthropic SDK for claude models
-                return LLM(
-                    model=f"openai/{model}",
-                    base_url=llm_config.openai_base_url,
-                    api_key=llm_config.openai_api_key,
-                )
-            else:
-                return LLM(
-                    model=model,
-                    api_key=llm_config.openai_api_key,
-                )
+            model = llm_config.resolved_model_for(self.role)
+        return build_llm(llm_config, model)
 
     @property
     def model(self) -> str:
         """Get the model name for this agent."""
-        if self._model:
-            return self._model
-        llm_config = get_llm_config()
-        return llm_config.get_model_for_role(self.role)
+        if self._cached_model is None:
+            if self._model:
+                self._cached_model = self._model
+            else:
+                self._cached_model = get_llm_config().get_model_for_role(self.role)
+        return self._cached_model
 
-    @abstractmethod
     def get_tools(self) -> list:
         """Get the tools available to this agent."""
-        pass
-
-    def get_base_tools(self) -> list:
+        # Tools don't depend on the instance, so build them once per class
+        cls = type(self)
+        tools = cls.__dict__.get("_tools_cache")
+        if tools is None:
+            tools = cls._build_tools()
+            cls._tools_cache = tools
+        return list(tools)
+
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build the tools available to agents of this class."""
+        raise NotImplementedError(f"{cls.__name__} must implement _build_tools()")
+
+    @classmethod
+    def get_base_tools(cls) -> list:
         """Get base tools available to all agents."""
-        return [
-            *FileSystemTool.get_tools(),
-            ShellExecutorTool(),
-        ]
+        return list(_get_base_tools_cached())
 
     def create_agent(self) -> Agent:
         """Create and return the CrewAI agent."""
         if self._agent is None:
+            kwargs: dict[str, Any] = {}
+            if self.max_iter is not None:
+                kwargs["max_iter"] = self.max_iter
             self._agent = Agent(
                 role=self.name,
                 goal=self.goal,
@@ -125,6 +176,7 @@ class BaseCrewForgeAgent(ABC):
                 verbose=self.verbose,
                 allow_delegation=self._allow_delegation(),
                 llm=self.get_llm(),
+                **kwargs,
             )
         return self._agent
 
@@ -1,28 +1,31 @@
 """Developer agent for code implementation."""
 
-from crewai import Agent
-
 from ...config import AgentRole
 from ...tools import (
     FileSystemTool,
     ShellExecutorTool,
     GitTool,
     WebSearchTool,
+    CodeSearchTool,
+    MultiCodeSearchTool,
     get_openspec_tools,
 )
-from .base import BaseCrewForgeAgent
+from .base import BaseCrewForgeAgent, clean_prompt
 
 
 class DeveloperAgent(BaseCrewForgeAgent):
     """Developer agent responsible for implementing code following OpenSpec."""
 
+    __slots__ = ()
+
     role = AgentRole.DEVELOPER
     name = "Senior Developer"
-    goal = """Write clean, efficient, and well-documented code that follows
+    max_iter = 15
+    goal = clean_prompt("""Write clean, efficient, and well-documented code that follows
     best practices and the OpenSpec architectural guidelines (SPEC.md and PLAN.md).
-    Implement features completely with proper error handling, logging, and tests."""
+    Implement features completely with proper error handling, logging, and tests.""")
 
-    backstory = """You are an expert full-stack developer proficient in multiple
+    backstory = clean_prompt("""You are an expert full-stack developer proficient in multiple
     programming languages and frameworks. You have extensive experience with:
     - Backend development (Go, Python, Rust, Node.js, Java)
     - Frontend development (React, Vue, Angular, TypeScript)
@@ -47,43 +50,32 @@ class DeveloperAgent(BaseCrewForgeAgent):
     - Consistent with OpenSpec specifications
 
     You always consider the bigger picture while implementing specific features,
-    ensuring consistency with the overall architecture and OpenSpec documentation."""
+    ensuring consistency with the overall architecture and OpenSpec documentation.""")
 
-    def get_tools(self) -> list:
-        """Get developer-specific tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build developer-specific tools."""
+        tools = cls.get_base_tools()
         tools.extend(GitTool.get_tools())
         tools.append(WebSearchTool())
+        tools.extend((CodeSearchTool(), MultiCodeSearchTool()))
         # Add OpenSpec tools to read and update specifications
         tools.extend(get_openspec_tools())
         return tools
 
-    def create_agent(self) -> Agent:
-        """Create the developer agent."""
-        if self._agent is None:
-            self._agent = Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=self.get_tools(),
-                verbose=self.verbose,
-                allow_delegation=False,
-                llm=self.get_llm(),
-                max_iter=15,
-            )
-        return self._agent
-
 
 class FrontendDeveloperAgent(BaseCrewForgeAgent):
     """Specialized frontend developer agent."""
 
+    __slots__ = ()
+
     role = AgentRole.DEVELOPER
     name = "Frontend Developer"
-    goal = """Create responsive, accessible, and performant user interfaces.
+    goal = clean_prompt("""Create responsive, accessible, and performant user interfaces.
     Implement frontend features with attention to UX, cross-browser compatibility,
-    and modern frontend best practices."""
+    and modern frontend best practices.""")
 
-    backstory = """You are a frontend specialist with deep expertise in:
+    backstory = clean_prompt("""You are a frontend specialist with deep expertise in:
     - Modern JavaScript/TypeScript
     - React, Vue, or Angular frameworks
     - CSS architecture (Tailwind, CSS-in-JS, SCSS)
@@ -92,22 +84,25 @@ class FrontendDeveloperAgent(BaseCrewForgeAgent):
     - Performance optimization
     - Responsive design
 
-    You create UIs that are beautiful, functional, and inclusive."""
+    You create UIs that are beautiful, functional, and inclusive.""")
 
-    def get_tools(self) -> list:
-        """Get frontend developer tools."""
-        return self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build frontend developer tools."""
+        return cls.get_base_tools()
 
 
 class BackendDeveloperAgent(BaseCrewForgeAgent):
     """Specialized backend developer agent."""
 
+    __slots__ = ()
+
     role = AgentRole.DEVELOPER
     name = "Backend Developer"
-    goal = """Build robust, scalable, and secure backend services.
-    Implement APIs, business logic, and data persistence with high reliability."""
+    goal = clean_prompt("""Build robust, scalable, and secure backend services.
+    Implement APIs, business logic, and data persistence with high reliability.""")
 
-    backstory = """You are a backend specialist with expertise in:
+    backstory = clean_prompt("""You are a backend specialist with expertise in:
     - Server-side languages (Go, Python, Rust, Java, Node.js)
     - API design and implementation
     - Database optimization and modeling
@@ -116,10 +111,11 @@ class BackendDeveloperAgent(BaseCrewForgeAgent):
     - Security best practices
     - Performance profiling and optimization
 
-    You build backends that are fast, secure, and maintainable."""
+    You build backends that are fast, secure, and maintainable.""")
 
-    def get_tools(self) -> list:
-        """Get backend developer tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build backend developer tools."""
+        tools = cls.get_base_tools()
         tools.extend(GitTool.get_tools())
         return tools
@@ -1,65 +1,12 @@
 """DevOps agent for deployment and infrastructure."""
 
-from crewai import Agent
-
 from ...config import AgentRole
 from ...tools import FileSystemTool, ShellExecutorTool, GitTool
-from .base import BaseCrewForgeAgent
-
-
-class DevOpsAgent(BaseCrewForgeAgent):
-    """DevOps agent responsible for CI/CD and infrastructure."""
-
-    role = AgentRole.DEVOPS
-    name = "DevOps Engineer"
-    goal = """Set up and maintain CI/CD pipelines, containerization, and
-    deployment configurations. Ensure smooth deployment processes and
-    infrastructure reliability."""
-
-    backstory = """You are an experienced DevOps engineer with expertise in:
-    - CI/CD pipelines (GitHub Actions, GitLab CI, Jenkins)
-    - Containerization (Docker, Podman)
-    - Container orchestration (Kubernetes, Docker Compose)
-    - Infrastructure as Code (Terraform, Pulumi)
-    - Cloud platforms (AWS, GCP, Azure)
-    - Monitoring and logging (Prometheus, Grafana, ELK)
-    - Security and compliance automation
+from .base import BaseCrewForgeAgent, clean_prompt
 
-    You create infrastructure that is:
-    - Reproducible and version-controlled
-    - Secure by default
-    - Observable with proper monitoring
-    - Cost-effective and right-sized
-    - Documented for team understanding
 
-    You follow the principle of "automate everything" and believe in
-    GitOps practices for infrastructure management."""
-
-    def get_tools(self) -> list:
-        """Get DevOps-specific tools."""
-        tools = self.get_base_tools()
-        tools.extend(GitTool.get_tools())
-        return tools
-
-    def create_agent(self) -> Agent:
-        """Create the DevOps agent."""
-        if self._agent is None:
-            self._agent = Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=self.get_tools(),
-                verbose=self.verbose,
-                allow_delegation=False,
-                llm=self.get_llm(),
-                max_iter=10,
-            )
-        return self._agent
-
-    def get_dockerfile_template(self, language: str) -> str:
-        """Get a Dockerfile template for a specific language."""
-        templates = {
-            "python": """FROM python:3.11-slim
+_DOCKERFILE_TEMPLATES = {
+    "python": """FROM python:3.11-slim
 
 WORKDIR /app
 
@@ -72,7 +19,7 @@ EXPOSE 8000
 
 CMD ["python", "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
 """,
-            "go": """FROM golang:1.21-alpine AS builder
+    "go": """FROM golang:1.21-alpine AS builder
 
 WORKDIR /app
 COPY go.mod go.sum ./
@@ -89,7 +36,7 @@ COPY --from=builder /app/main .
 EXPOSE 8080
 CMD ["./main"]
 """,
-            "node": """FROM node:20-alpine
+    "node": """FROM node:20-alpine
 
 WORKDIR /app
 
@@ -102,7 +49,7 @@ EXPOSE 3000
 
 CMD ["node", "index.js"]
 """,
-            "rust": """FROM rust:1.74 AS builder
+    "rust": """FROM rust:1.74 AS builder
 
 WORKDIR /app
 COPY . .
@@ -115,14 +62,10 @@ COPY --from=builder /app/target/release/app /usr/local/bin/
 EXPOSE 8080
 CMD ["app"]
 """,
-        }
-
-        return templates.get(language.lower(), templates["python"])
+}
 
-    def get_github_actions_template(self, language: str) -> str:
-        """Get a GitHub Actions workflow template."""
-        templates = {
-            "python": """name: CI
+_GITHUB_ACTIONS_TEMPLATES = {
+    "python": """name: CI
 
 on:
   push:
@@ -147,7 +90,7 @@ jobs:
       - name: Upload coverage
         uses: codecov/codecov-action@v3
 """,
-            "go": """name: CI
+    "go": """name: CI
 
 on:
   push:
@@ -168,7 +111,7 @@ jobs:
       - name: Upload coverage
         uses: codecov/codecov-action@v3
 """,
-            "node": """name: CI
+    "node": """name: CI
 
 on:
   push:
@@ -188,6 +131,53 @@ jobs:
       - run: npm ci
       - run: npm test
 """,
-        }
+}
 
-        return templates.get(language.lower(), templates["python"])
+
+class DevOpsAgent(BaseCrewForgeAgent):
+    """DevOps agent responsible for CI/CD and infrastructure."""
+
+    __slots__ = ()
+
+    role = AgentRole.DEVOPS
+    name = "DevOps Engineer"
+    max_iter = 10
+    goal = clean_prompt("""Set up and maintain CI/CD pipelines, containerization, and
+    deployment configurations. Ensure smooth deployment processes and
+    infrastructure reliability.""")
+
+    backstory = clean_prompt("""You are an experienced DevOps engineer with expertise in:
+    - CI/CD pipelines (GitHub Actions, GitLab CI, Jenkins)
+    - Containerization (Docker, Podman)
+    - Container orchestration (Kubernetes, Docker Compose)
+    - Infrastructure as Code (Terraform, Pulumi)
+    - Cloud platforms (AWS, GCP, Azure)
+    - Monitoring and logging (Prometheus, Grafana, ELK)
+    - Security and compliance automation
+
+    You create infrastructure that is:
+    - Reproducible and version-controlled
+    - Secure by default
+    - Observable with proper monitoring
+    - Cost-effective and right-sized
+    - Documented for team understanding
+
+    You follow the principle of "automate everything" and believe in
+    GitOps practices for infrastructure management.""")
+
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build DevOps-specific tools."""
+        tools = cls.get_base_tools()
+        tools.extend(GitTool.get_tools())
+        return tools
+
+    def get_dockerfile_template(self, language: str) -> str:
+        """Get a Dockerfile template for a specific language."""
+        return _DOCKERFILE_TEMPLATES.get(language.lower(), _DOCKERFILE_TEMPLATES["python"])
+
+    def get_github_actions_template(self, language: str) -> str:
+        """Get a GitHub Actions workflow template."""
+        return _GITHUB_ACTIONS_TEMPLATES.get(
+            language.lower(), _GITHUB_ACTIONS_TEMPLATES["python"]
+        )
@@ -1,22 +1,73 @@
 """Code reviewer agent for quality assurance."""
 
-from crewai import Agent
-
 from ...config import AgentRole
 from ...tools import FileSystemTool, ShellExecutorTool, GitTool
-from .base import BaseCrewForgeAgent
+from .base import BaseCrewForgeAgent, clean_prompt
+
+
+_COMMON_REVIEW_CHECKS = """
+## Common Review Checklist
+- [ ] Code compiles/runs without errors
+- [ ] No obvious logic errors
+- [ ] Error handling is appropriate
+- [ ] No hardcoded secrets or credentials
+- [ ] Code is readable and well-named
+- [ ] Comments explain "why", not "what"
+- [ ] No unused code or imports
+- [ ] Consistent formatting
+"""
+
+_LANGUAGE_REVIEW_CHECKS = {
+    "python": """
+## Python-Specific
+- [ ] Type hints are used appropriately
+- [ ] No mutable default arguments
+- [ ] Context managers for resources
+- [ ] PEP 8 compliance
+""",
+    "javascript": """
+## JavaScript-Specific
+- [ ] No var, use const/let
+- [ ] Async/await used correctly
+- [ ] No console.log in production code
+- [ ] Proper null/undefined handling
+""",
+    "go": """
+## Go-Specific
+- [ ] Errors are handled, not ignored
+- [ ] No goroutine leaks
+- [ ] Proper defer usage
+- [ ] go fmt applied
+""",
+    "rust": """
+## Rust-Specific
+- [ ] No unwrap() in production code
+- [ ] Proper lifetime annotations
+- [ ] cargo clippy passes
+- [ ] Memory safety verified
+""",
+}
+
+# Full checklist per language, so lookups don't concatenate on every call
+_REVIEW_CHECKLISTS = {
+    language: _COMMON_REVIEW_CHECKS + checks
+    for language, checks in _LANGUAGE_REVIEW_CHECKS.items()
+}
 
 
 class ReviewerAgent(BaseCrewForgeAgent):
     """Code reviewer agent responsible for code quality and standards."""
 
+    __slots__ = ()
+
     role = AgentRole.REVIEWER
     name = "Senior Code Reviewer"
-    goal = """Review code for quality, correctness, security, and adherence to
+    max_iter = 10
+    goal = clean_prompt("""Review code for quality, correctness, security, and adherence to
     best practices. Provide constructive feedback and suggestions for improvement.
-    Ensure code meets the project's standards before merging."""
+    Ensure code meets the project's standards before merging.""")
 
-    backstory = """You are a meticulous code reviewer with extensive experience
+    backstory = clean_prompt("""You are a meticulous code reviewer with extensive experience
     across multiple languages and paradigms. You have reviewed thousands of pull
     requests and have developed a keen eye for:
 
@@ -36,76 +87,15 @@ class ReviewerAgent(BaseCrewForgeAgent):
 
     You balance thoroughness with pragmatism, understanding that perfect is
     the enemy of good. You know when to approve code with minor suggestions
-    versus when to request changes for critical issues."""
+    versus when to request changes for critical issues.""")
 
-    def get_tools(self) -> list:
-        """Get reviewer-specific tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build reviewer-specific tools."""
+        tools = cls.get_base_tools()
         tools.extend(GitTool.get_tools())
         return tools
 
-    def create_agent(self) -> Agent:
-        """Create the reviewer agent."""
-        if self._agent is None:
-            self._agent = Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=self.get_tools(),
-                verbose=self.verbose,
-                allow_delegation=False,
-                llm=self.get_llm(),
-                max_iter=10,
-            )
-        return self._agent
-
     def generate_review_checklist(self, language: str) -> str:
         """Generate a language-specific review checklist."""
-        common_checks = """
-        ## Common Review Checklist
-        - [ ] Code compiles/runs without errors
-        - [ ] No obvious logic errors
-        - [ ] Error handling is appropriate
-        - [ ] No hardcoded secrets or credentials
-        - [ ] Code is readable and well-named
-        - [ ] Comments explain "why", not "what"
-        - [ ] No unused code or imports
-        - [ ] Consistent formatting
-        """
-
-        language_checks = {
-            "python": """
-            ## Python-Specific
-            - [ ] Type hints are used appropriately
-            - [ ] No mutable default arguments
-            - [ ] Context managers for resources
-            - [ ] PEP 8 compliance
-            """,
-            "javascript": """
-            ## JavaScript-Specific
-            - [ ] No var, use const/let
-            - [ ] Async/await used correctly
-            - [ ] No console.log in production code
-            - [ ] Proper null/undefined handling
-            """,
-            "go": """
-            ## Go-Specific
-            - [ ] Errors are handled, not ignored
-            - [ ] No goroutine leaks
-            - [ ] Proper defer usage
-            - [ ] go fmt applied
-            """,
-            "rust": """
-            ## Rust-Specific
-            - [ ] No unwrap() in production code
-            - [ ] Proper lifetime annotations
-            - [ ] cargo clippy passes
-            - [ ] Memory safety verified
-            """,
-        }
-
-        checks = common_checks
-        if language.lower() in language_checks:
-            checks += language_checks[language.lower()]
-
-        return checks
+        return _REVIEW_CHECKLISTS.get(language.lower(), _COMMON_REVIEW_CHECKS)
@@ -1,22 +1,56 @@
 """Tester agent for test creation and execution."""
 
-from crewai import Agent
-
 from ...config import AgentRole
 from ...tools import FileSystemTool, ShellExecutorTool, BrowserTool
-from .base import BaseCrewForgeAgent
+from .base import BaseCrewForgeAgent, clean_prompt
+
+
+_TEST_COMMANDS = {
+    "python": {
+        "run_tests": "pytest -v",
+        "run_coverage": "pytest --cov=. --cov-report=html",
+        "run_single": "pytest -v {test_file}::{test_name}",
+    },
+    "javascript": {
+        "run_tests": "npm test",
+        "run_coverage": "npm test -- --coverage",
+        "run_single": "npm test -- {test_file}",
+    },
+    "typescript": {
+        "run_tests": "npm test",
+        "run_coverage": "npm test -- --coverage",
+        "run_single": "npm test -- {test_file}",
+    },
+    "go": {
+        "run_tests": "go test ./...",
+        "run_coverage": "go test -coverprofile=coverage.out ./...",
+        "run_single": "go test -v -run {test_name} ./{package}",
+    },
+    "rust": {
+        "run_tests": "cargo test",
+        "run_coverage": "cargo tarpaulin",
+        "run_single": "cargo test {test_name}",
+    },
+}
+
+_UNKNOWN_TEST_COMMANDS = {
+    "run_tests": "echo 'Unknown language, please specify test command'",
+}
 
 
 class TesterAgent(BaseCrewForgeAgent):
     """Tester agent responsible for testing and quality assurance."""
 
+    __slots__ = ()
+
     role = AgentRole.TESTER
     name = "QA Engineer"
-    goal = """Create comprehensive test suites and ensure software quality.
+    max_iter = 15
+    goal = clean_prompt("""Create comprehensive test suites and ensure software quality.
     Write unit tests, integration tests, and E2E tests. Identify edge cases
-    and ensure proper test coverage. Execute tests and report results clearly."""
+    and ensure proper test coverage. Execute tests and report results clearly.""")
 
-    backstory = """You are an experienced QA engineer with expertise in:
+    backstory = clean_prompt("""You are an experienced QA engineer with expertise in:
     - Test-driven development (TDD) and behavior-driven development (BDD)
     - Unit testing frameworks (pytest, Jest, Go testing, JUnit)
     - Integration testing strategies
@@ -37,73 +71,32 @@ class TesterAgent(BaseCrewForgeAgent):
     - Independent and isolated
     - Fast and reliable (no flaky tests)
     - Covering both happy paths and error cases
-    - Following the AAA pattern (Arrange, Act, Assert)"""
+    - Following the AAA pattern (Arrange, Act, Assert)""")
 
-    def get_tools(self) -> list:
-        """Get tester-specific tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build tester-specific tools."""
+        tools = cls.get_base_tools()
         tools.extend(BrowserTool.get_tools())
         return tools
 
-    def create_agent(self) -> Agent:
-        """Create the tester agent."""
-        if self._agent is None:
-            self._agent = Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=self.get_tools(),
-                verbose=self.verbose,
-                allow_delegation=False,
-                llm=self.get_llm(),
-                max_iter=15,
-            )
-        return self._agent
-
     def get_test_commands(self, language: str) -> dict:
         """Get test commands for a specific language."""
-        commands = {
-            "python": {
-                "run_tests": "pytest -v",
-                "run_coverage": "pytest --cov=. --cov-report=html",
-                "run_single": "pytest -v {test_file}::{test_name}",
-            },
-            "javascript": {
-                "run_tests": "npm test",
-                "run_coverage": "npm test -- --coverage",
-                "run_single": "npm test -- {test_file}",
-            },
-            "typescript": {
-                "run_tests": "npm test",
-                "run_coverage": "npm test -- --coverage",
-                "run_single": "npm test -- {test_file}",
-            },
-            "go": {
-                "run_tests": "go test ./...",
-                "run_coverage": "go test -coverprofile=coverage.out ./...",
-                "run_single": "go test -v -run {test_name} ./{package}",
-            },
-            "rust": {
-                "run_tests": "cargo test",
-                "run_coverage": "cargo tarpaulin",
-                "run_single": "cargo test {test_name}",
-            },
-        }
-
-        return commands.get(language.lower(), {
-            "run_tests": "echo 'Unknown language, please specify test command'",
-        })
+        # Copy so callers can't mutate the shared table
+        return dict(_TEST_COMMANDS.get(language.lower(), _UNKNOWN_TEST_COMMANDS))
 
 
 class E2ETestAgent(BaseCrewForgeAgent):
     """Specialized E2E testing agent with browser automation focus."""
 
+    __slots__ = ()
+
     role = AgentRole.TESTER
     name = "E2E Test Engineer"
-    goal = """Create and execute end-to-end tests that verify complete user flows.
-    Use browser automation to test web applications thoroughly."""
+    goal = clean_prompt("""Create and execute end-to-end tests that verify complete user flows.
+    Use browser automation to test web applications thoroughly.""")
 
-    backstory = """You are an E2E testing specialist with deep expertise in
+    backstory = clean_prompt("""You are an E2E testing specialist with deep expertise in
     browser automation using Playwright. You excel at:
     - Writing reliable, non-flaky E2E tests
     - Testing complex user workflows
@@ -113,10 +106,11 @@ class E2ETestAgent(BaseCrewForgeAgent):
     - Accessibility testing with automated tools
 
     You create E2E tests that provide confidence in the application's
-    user-facing functionality while maintaining fast execution times."""
+    user-facing functionality while maintaining fast execution times.""")
 
-    def get_tools(self) -> list:
-        """Get E2E tester tools."""
-        tools = self.get_base_tools()
+    @classmethod
+    def _build_tools(cls) -> list:
+        """Build E2E tester tools."""
+        tools = cls.get_base_tools()
         tools.extend(BrowserTool.get_tools())
         return tools
@@ -1,15 +1,18 @@
 """Core CrewAI orchestration for CrewForge."""
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Optional, Callable
 from datetime import datetime
 
+import yaml
 from crewai import Crew, Task, Process
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from ..config import get_settings, get_llm_config
+from ..config import AgentRole, get_settings, get_llm_config
 from ..storage import get_database, TaskStatus, ProjectStatus
 from .manager import ManagerAgent
 from .agents import (
@@ -20,10 +23,125 @@ from .agents import (
     DevOpsAgent,
 )
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 console = Console()
 
 
+def _find_tech_stack_block(text: str) -> Optional[str]:
+    """Return the body of the first ```yaml fence that starts with ``tech_stack:``.
+
+    A plain index scan stays linear even when a fence is left unclosed.
+    """
+    start = text.find("```yaml")
+    while start != -1:
+        body = start + len("```yaml")
+        content = body
+        while content < len(text) and text[content].isspace():
+            content += 1
+        if "\n" in text[body:content] and text.startswith("tech_stack:", content):
+            end = text.find("```", content)
+            return text[content:end] if end != -1 else None
+        start = text.find("```yaml", body)
+    return None
+
+
+# Static instructions come first and the requirements last, so the prompt prefix stays
+# identical across runs and provider-side prompt caching can reuse it.
+_ARCHITECTURE_INSTRUCTIONS = """Design the software architecture for the requirements \
+at the end of this prompt using OpenSpec format.
+
+## Your Tasks:
+
+### 1. Create SPEC.md (Functional Specification)
+Use the write_openspec tool with file_type='spec' to create SPEC.md containing:
+
+**Purpose**: What this system does and why it exists
+**Scope**: What's in scope and out of scope
+**Functional Requirements**: Detailed feature specifications with acceptance criteria
+**Non-Functional Requirements**: Performance, security, scalability, availability
+**User Stories/Use Cases**: Key user workflows
+**Constraints and Assumptions**: Technical or business constraints
+
+### 2. Create PLAN.md (Implementation Plan)
+Use the write_openspec tool with file_type='plan' to create PLAN.md containing:
+
+**Technology Stack Recommendation**:
+Format the tech stack as YAML code block:
+```yaml
+tech_stack:
+  type: frontend-only | backend-only | fullstack | cli | library | other
+  # Include only relevant sections:
+  frontend:  # if applicable
+    language: ...
+    framework: ...
+    build_tool: ...
+  backend:   # if applicable
+    language: ...
+    framework: ...
+  database:  # if applicable
+    type: ...
+    name: ...
+  infrastructure:  # if applicable
+    ...
+```
+
+**Architecture Overview**: High-level system design and key components
+**Component Breakdown**: Detailed module/service structure
+**Data Models**: Database schema, entities, relationships
+**API Design**: Endpoints, contracts, interfaces (if applicable)
+**File/Folder Structure**: Recommended project layout
+**Dependencies**: External libraries and services
+**Implementation Phases**: Suggested development order
+**Design Decisions**: Key architectural choices and rationale
+
+### 3. Guidelines
+- Be specific and measurable
+- Focus on "what" and "why" in SPEC.md
+- Focus on "how" and architecture in PLAN.md
+- Use clear, unambiguous language
+- Include examples where helpful
+- Think about future maintainability
+
+Use the write_openspec tool to create both SPEC.md and PLAN.md files."""
+
+
+# Shared across every implementation task; only the OpenSpec context and task details
+# that follow it vary.
+_IMPLEMENTATION_INSTRUCTIONS = """Implement the task described at the end of this prompt \
+following OpenSpec specifications.
+
+=== Requirements ===
+1. Follow SPEC.md functional requirements and acceptance criteria
+2. Adhere to PLAN.md architecture, design patterns, and file structure
+3. Write clean, well-documented code
+4. Include appropriate error handling
+5. Write unit tests for new code
+6. Commit changes with meaningful messages
+7. If implementation requires deviating from PLAN.md, document the change
+
+Important: Refer to the OpenSpec documentation below for architectural decisions,
+coding standards, and implementation guidelines."""
+
+# Workflow phases after requirements confirmation, in order
+_PHASES = ("architecture", "breakdown", "implementation", "testing")
+
+# Phase a resumed project re-enters at, by stored project status
+_RESUME_PHASES = {
+    ProjectStatus.REQUIREMENTS_APPROVED: "architecture",
+    ProjectStatus.ARCHITECTURE_PENDING: "architecture",
+    ProjectStatus.ARCHITECTURE_APPROVED: "breakdown",
+    ProjectStatus.DEVELOPING: "implementation",
+    ProjectStatus.TESTING: "testing",
+}
+
+
 class CrewForgeOrchestrator:
     """Main orchestrator for CrewForge multi-agent development."""
 
@@ -46,6 +164,7 @@ class CrewForgeOrchestrator:
         self.project_path = Path(project_path) if project_path else Path.cwd() / project_name
         self.verbose = verbose
         self.on_approval_needed = on_approval_needed or self._default_approval
+        self._progress: Optional[Progress] = None
 
         self.settings = get_settings()
         self.llm_config = get_llm_config()
@@ -131,7 +250,28 @@ class CrewForgeOrchestrator:
                     results["message"] = "Requirements not approved"
                     return results
 
-            # Phase 2: Architecture design
+            # Phases 2-6: architecture, task breakdown, implementation, testing, merge
+            self._run_phases(results, requirements)
+
+        except Exception as e:
+            results["status"] = "failed"
+            results["error"] = str(e)
+            console.print(f"[red]Error: {e}[/]")
+
+        return results
+
+    def _run_phases(
+        self,
+        results: dict,
+        requirements: str,
+        start: str = "architecture",
+        architecture: str = "",
+    ) -> None:
+        """Run the workflow from ``start`` (one of ``_PHASES``) to the end, filling ``results``."""
+        start_at = _PHASES.index(start)
+
+        # Phase 2: Architecture design
+        if start_at <= _PHASES.index("architecture"):
             architecture = self._design_architecture(requirements)
             results["phases"]["architecture"] = architecture
 
@@ -139,44 +279,68 @@ class CrewForgeOrchestrator:
                 if not self._confirm_architecture(architecture):
                     results["status"] = "cancelled"
                     results["message"] = "Architecture not approved"
-                    return results
+                    return
 
-            # Phase 3: Task breakdown and execution
+        # Phase 3: Task breakdown, reusing tasks already stored by an interrupted run
+        tasks = self._load_tasks() if start_at > _PHASES.index("architecture") else []
+        if start_at <= _PHASES.index("breakdown") and not tasks:
             tasks = self._break_down_tasks(requirements, architecture)
             results["phases"]["task_breakdown"] = tasks
 
-            # Phase 4: Implementation
+        # Phase 4: Implementation
+        if start_at <= _PHASES.index("implementation") and tasks:
             implementation = self._run_implementation(tasks)
             results["phases"]["implementation"] = implementation
 
-            # Phase 5: Testing
-            testing = self._run_testing()
-            results["phases"]["testing"] = testing
-
-            # Phase 6: Final merge to main
-            self._finalize_project()
-            results["status"] = "completed"
-
-        except Exception as e:
-            results["status"] = "failed"
-            results["error"] = str(e)
-            console.print(f"[red]Error: {e}[/]")
-
-        return results
+        # Phase 5: Testing
+        testing = self._run_testing()
+        results["phases"]["testing"] = testing
+
+        # Phase 6: Final merge to main
+        self._finalize_project()
+        results["status"] = "completed"
+
+    def _load_tasks(self) -> list:
+        """Load the project's pending tasks in the format produced by _parse_tasks."""
+        return [
+            {"title": task.title, "description": task.description or ""}
+            for task in self.db.get_pending_tasks(self.project.id)
+        ]
+
+    def _kickoff(self, crew: Crew, description: str):
+        """Run a crew behind a spinner, reusing one Progress display across phases."""
+        if self._progress is None:
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            )
+        task_id = self._progress.add_task(description, total=None)
+        self._progress.start()
+        try:
+            return crew.kickoff()
+        finally:
+            self._progress.stop()
+            self._progress.remove_task(task_id)
 
     def _confirm_requirements(self, requirements: str) -> bool:
         """Confirm requirements with user."""
         console.print("\n[bold]Phase 1: Requirements Confirmation[/]\n")
 
         # Store requirements
-        self.db.update_project_requirements(self.project.id, requirements)
-        self.db.update_project_status(self.project.id, ProjectStatus.REQUIREMENTS_PENDING)
+        self.db.update_project_requirements(
+            self.project.id, requirements, status=ProjectStatus.REQUIREMENTS_PENDING
+        )
 
         approved = self.on_approval_needed("Requirements Review", requirements)
 
         if approved:
-            self.db.update_project_requirements(self.project.id, requirements, approved=True)
-            self.db.update_project_status(self.project.id, ProjectStatus.REQUIREMENTS_APPROVED)
+            self.db.update_project_requirements(
+                self.project.id,
+                requirements,
+                approved=True,
+                status=ProjectStatus.REQUIREMENTS_APPROVED,
+            )
             console.print("[green]Requirements approved[/]")
         else:
             console.print("[red]Requirements rejected[/]")
@@ -191,63 +355,9 @@ class CrewForgeOrchestrator:
 
         # Create architecture task - Architect analyzes requirements and creates OpenSpec docs
         arch_task = Task(
-            description=f"""Analyze the following requirements and design the software architecture using OpenSpec format:
-
-{requirements}
-
-## Your Tasks:
-
-### 1. Create SPEC.md (Functional Specification)
-Use the write_openspec tool with file_type='spec' to create SPEC.md containing:
-
-**Purpose**: What this system does and why it exists
-**Scope**: What's in scope and out of scope
-**Functional Requirements**: Detailed feature specifications with acceptance criteria
-**Non-Functional Requirements**: Performance, security, scalability, availability
-**User Stories/Use Cases**: Key user workflows
-**Constraints and Assumptions**: Technical or business constraints
-
-### 2. Create PLAN.md (Implementation Plan)
-Use the write_openspec tool with file_type='plan' to create PLAN.md containing:
-
-**Technology Stack Recommendation**:
-Format the tech stack as YAML code block:
-```yaml
-tech_stack:
-  type: frontend-only | backend-only | fullstack | cli | library | other
-  # Include only relevant sections:
-  frontend:  # if applicable
-    language: ...
-    framework: ...
-    build_tool: ...
-  backend:   # if applicable
-    language: ...
-    framework: ...
-  database:  # if applicable
-    type: ...
-    name: ...
-  infrastructure:  # if applicable
-    ...
-```
-
-**Architecture Overview**: High-level system design and key components
-**Component Breakdown**: Detailed module/service structure
-**Data Models**: Database schema, entities, relationships
-**API Design**: Endpoints, contracts, interfaces (if applicable)
-**File/Folder Structure**: Recommended project layout
-**Dependencies**: External libraries and services
-**Implementation Phases**: Suggested development order
-**Design Decisions**: Key architectural choices and rationale
-
-### 3. Guidelines
-- Be specific and measurable
-- Focus on "what" and "why" in SPEC.md
-- Focus on "how" and architecture in PLAN.md
-- Use clear, unambiguous language
-- Include examples where helpful
-- Think about future maintainability
-
-Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
+            description=(
+                f"{_ARCHITECTURE_INSTRUCTIONS}\n\n## Requirements:\n\n{requirements}"
+            ),
             expected_output="OpenSpec documentation created: SPEC.md and PLAN.md with tech stack and architecture details",
             agent=self.architect.create_agent(),
         )
@@ -260,13 +370,7 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
             process=Process.sequential,
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Designing architecture...", total=None)
-            result = crew.kickoff()
+        result = self._kickoff(crew, "Designing architecture...")
 
         architecture = str(result)
         self.db.update_project_architecture(self.project.id, architecture)
@@ -279,9 +383,6 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
 
     def _save_tech_stack(self, architecture: str):
         """Extract tech_stack from OpenSpec PLAN.md and save to crewforge.yaml."""
-        import yaml
-        import re
-
         config_path = self.project_path / "crewforge.yaml"
         if not config_path.exists():
             return
@@ -294,27 +395,21 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
             try:
                 plan_content = openspec_plan.read_text(encoding="utf-8")
                 # Extract tech_stack YAML block from PLAN.md
-                yaml_pattern = r"```yaml\s*\n(tech_stack:.*?)```"
-                match = re.search(yaml_pattern, plan_content, re.DOTALL)
-                if match:
-                    tech_stack_source = match.group(1)
+                tech_stack_source = _find_tech_stack_block(plan_content)
             except Exception as e:
                 console.print(f"[dim]Could not read PLAN.md: {e}[/]")
 
         # Fallback to extracting from architecture output (for backward compatibility)
         if not tech_stack_source:
-            yaml_pattern = r"```yaml\s*\n(tech_stack:.*?)```"
-            match = re.search(yaml_pattern, architecture, re.DOTALL)
-            if match:
-                tech_stack_source = match.group(1)
+            tech_stack_source = _find_tech_stack_block(architecture)
 
         if tech_stack_source:
             try:
-                tech_stack_data = yaml.safe_load(tech_stack_source)
+                tech_stack_data = yaml.load(tech_stack_source, Loader=_YamlLoader)
 
                 # Load existing config
                 with open(config_path) as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=_YamlLoader) or {}
 
                 # Update tech_stack
                 if tech_stack_data and "tech_stack" in tech_stack_data:
@@ -324,7 +419,10 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
 
                 # Save updated config
                 with open(config_path, "w") as f:
-                    yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                    yaml.dump(
+                        config, f, Dumper=_YamlDumper,
+                        default_flow_style=False, sort_keys=False, allow_unicode=True,
+                    )
 
                 console.print("[dim]Tech stack saved to crewforge.yaml from OpenSpec[/]")
             except Exception as e:
@@ -335,8 +433,12 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
         approved = self.on_approval_needed("Architecture Review", architecture)
 
         if approved:
-            self.db.update_project_architecture(self.project.id, architecture, approved=True)
-            self.db.update_project_status(self.project.id, ProjectStatus.ARCHITECTURE_APPROVED)
+            self.db.update_project_architecture(
+                self.project.id,
+                architecture,
+                approved=True,
+                status=ProjectStatus.ARCHITECTURE_APPROVED,
+            )
             console.print("[green]Architecture approved[/]")
         else:
             console.print("[red]Architecture rejected[/]")
@@ -355,51 +457,70 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
             agent=self.manager.create_agent(),
         )
 
-        crew = Crew(
-            agents=[self.manager.create_agent()],
-            tasks=[breakdown_task],
-            verbose=self.verbose,
-            process=Process.sequential,
-        )
+        # The breakdown has no side effects, so a deterministic rerun can reuse it
+        cache_key = self._response_cache_key(AgentRole.MANAGER, breakdown_task)
+        task_breakdown = self._get_cached_response(cache_key)
+
+        if task_breakdown is None:
+            crew = Crew(
+                agents=[self.manager.create_agent()],
+                tasks=[breakdown_task],
+                verbose=self.verbose,
+                process=Process.sequential,
+            )
+
+            result = self._kickoff(crew, "Breaking down tasks...")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Breaking down tasks...", total=None)
-            result = crew.kickoff()
+            task_breakdown = str(result)
+            self._set_cached_response(cache_key, task_breakdown)
 
-        task_breakdown = str(result)
         console.print("[green]Task breakdown completed[/]")
         return self._parse_tasks(task_breakdown)
 
+    def _response_cache_key(self, role: AgentRole, task: Task) -> Optional[str]:
+        """Key a crew response by model and prompt; None when output isn't deterministic."""
+        if self.llm_config.temperature != 0:
+            return None
+        payload = json.dumps(
+            {
+                "model": self.llm_config.resolved_model_for(role),
+                "prompt": task.description,
+                "expected": task.expected_output,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _get_cached_response(self, key: Optional[str]) -> Optional[str]:
+        """Look up a cached crew response."""
+        if key is None:
+            return None
+        response = self.db.get_cached_response(key)
+        if response is not None:
+            console.print("[dim]Cache hit, reusing previous LLM response[/]")
+        return response
+
+    def _set_cached_response(self, key: Optional[str], response: str) -> None:
+        """Store a crew response for later reuse."""
+        if key is not None:
+            self.db.set_cached_response(key, response)
+
     def _parse_tasks(self, task_breakdown: str) -> list:
         """Parse task breakdown into structured tasks."""
         # Simple parsing - in production, use structured output
         tasks = []
-        lines = task_breakdown.split("\n")
-        current_task = {}
-
-        for line in lines:
+        for line in task_breakdown.splitlines():
             line = line.strip()
-            if line.startswith("- ") or line.startswith("* "):
-                if current_task:
-                    tasks.append(current_task)
-                current_task = {"title": line[2:], "description": ""}
-            elif current_task and line:
-                current_task["description"] += line + " "
+            if line.startswith(("- ", "* ")):
+                tasks.append({"title": line[2:], "description": []})
+            elif tasks and line:
+                tasks[-1]["description"].append(line)
 
-        if current_task:
-            tasks.append(current_task)
+        for task_data in tasks:
+            task_data["description"] = " ".join(task_data["description"])
 
         # Create tasks in database
-        for task_data in tasks:
-            self.db.create_task(
-                project_id=self.project.id,
-                title=task_data.get("title", "Untitled"),
-                description=task_data.get("description", ""),
-            )
+        self.db.bulk_create_tasks(self.project.id, tasks)
 
         return tasks
 
@@ -423,13 +544,7 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
             manager_agent=self.manager.create_agent(as_manager=True),
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Implementing features...", total=None)
-            result = crew.kickoff()
+        result = self._kickoff(crew, "Implementing features...")
 
         console.print("[green]Implementation completed[/]")
         return {"result": str(result)}
@@ -466,31 +581,38 @@ Use the write_openspec tool to create both SPEC.md and PLAN.md files.""",
         """Create CrewAI tasks for implementation with OpenSpec context."""
         crewai_tasks = []
 
-        # Read OpenSpec context once for all tasks
         openspec_context = self._read_openspec_context()
 
+        # LLM breakdowns often repeat a task; submit each one only once
+        seen = set()
+        unique_tasks = []
         for task_data in tasks:
-            task = Task(
-                description=f"""Implement the following task following OpenSpec specifications:
-
-=== OpenSpec Context ===
-{openspec_context}
-
-=== Task Details ===
-Title: {task_data.get('title', 'Task')}
-Description: {task_data.get('description', '')}
-
-=== Requirements ===
-1. Follow SPEC.md functional requirements and acceptance criteria
-2. Adhere to PLAN.md architecture, design patterns, and file structure
-3. Write clean, well-documented code
-4. Include appropriate error handling
-5. Write unit tests for new code
-6. Commit changes with meaningful messages
-7. If implementation requires deviating from PLAN.md, document the change
+            key = (
+                task_data.get("title", "").strip().lower(),
+                task_data.get("description", "").strip().lower(),
+            )
+            if key not in seen:
+                seen.add(key)
+                unique_tasks.append(task_data)
+
+        duplicates = len(tasks) - len(unique_tasks)
+        if duplicates:
+            console.print(f"[dim]Skipped {duplicates} duplicate task(s)[/]")
+
+        # Instructions and OpenSpec context are identical for every task: build that
+        # shared prefix once and append only the per-task details
+        prefix = (
+            f"{_IMPLEMENTATION_INSTRUCTIONS}\n\n"
+            f"=== OpenSpec Context ===\n{openspec_context}\n\n"
+            "=== Task Details ===\n"
+        )
 
-Important: Refer to OpenSpec documentation above for architectural decisions,
-coding standards, and implementation guidelines.""",
+        for task_data in unique_tasks:
+            task = Task(
+                description=(
+                    f"{prefix}Title: {task_data.get('title', 'Task')}\n"
+                    f"Description: {task_data.get('description', '')}"
+                ),
                 expected_output="Implemented feature following OpenSpec with tests and documentation",
                 agent=self.developer.create_agent(),
             )
@@ -523,13 +645,7 @@ coding standards, and implementation guidelines.""",
             process=Process.sequential,
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task("Running tests...", total=None)
-            result = crew.kickoff()
+        result = self._kickoff(crew, "Running tests...")
 
         console.print("[green]Testing completed[/]")
         return {"result": str(result)}
@@ -557,41 +673,51 @@ coding standards, and implementation guidelines.""",
         if not project:
             return {"status": "error", "message": "Project not found"}
 
-        # Get pending tasks
-        pending_tasks = self.db.get_pending_tasks(project.id)
+        if project.status == ProjectStatus.COMPLETED:
+            return {"status": "completed", "message": "Project already completed"}
 
-        if not pending_tasks:
-            return {"status": "completed", "message": "No pending tasks"}
+        # Requirements were never approved, so start over from the beginning
+        start = _RESUME_PHASES.get(project.status)
+        if start is None:
+            return self.run(project.requirements or "")
 
-        console.print(f"Found {len(pending_tasks)} pending tasks")
+        # Re-enter the workflow at the phase the stored status points to, reusing the
+        # approved requirements and architecture instead of regenerating them
+        console.print(f"Resuming from phase: {start}")
+        results = {
+            "project_name": self.project_name,
+            "project_path": str(self.project_path),
+            "status": "resumed",
+            "phases": {},
+        }
 
-        # Resume from where we left off based on project status
-        if project.status == ProjectStatus.REQUIREMENTS_PENDING:
-            return self.run(project.requirements or "")
-        elif project.status == ProjectStatus.ARCHITECTURE_PENDING:
-            architecture = self._design_architecture(project.requirements or "")
-            # Continue with implementation...
+        try:
+            self._run_phases(
+                results,
+                project.requirements or "",
+                start=start,
+                architecture=project.architecture or "",
+            )
+        except Exception as e:
+            results["status"] = "failed"
+            results["error"] = str(e)
+            console.print(f"[red]Error: {e}[/]")
 
-        return {"status": "resumed", "pending_tasks": len(pending_tasks)}
+        return results
 
     def get_status(self) -> dict:
         """Get current project status."""
         project = self.db.get_project(self.project.id)
-        tasks = self.db.get_project_tasks(self.project.id)
-
-        completed = [t for t in tasks if t.status == TaskStatus.COMPLETED]
-        pending = [t for t in tasks if t.status == TaskStatus.PENDING]
-        in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
-        failed = [t for t in tasks if t.status == TaskStatus.FAILED]
+        counts = self.db.get_task_status_counts([self.project.id])[self.project.id]
 
         return {
             "project_name": project.name,
             "status": project.status.value if project else "unknown",
             "tasks": {
-                "total": len(tasks),
-                "completed": len(completed),
-                "pending": len(pending),
-                "in_progress": len(in_progress),
-                "failed": len(failed),
+                "total": sum(counts.values()),
+                "completed": counts.get(TaskStatus.COMPLETED, 0),
+                "pending": counts.get(TaskStatus.PENDING, 0),
+                "in_progress": counts.get(TaskStatus.IN_PROGRESS, 0),
+                "failed": counts.get(TaskStatus.FAILED, 0),
             },
         }
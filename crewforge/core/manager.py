@@ -1,12 +1,51 @@
 """Manager agent for task orchestration and delegation."""
 
-import os
 from typing import Optional, Any
 
-from crewai import Agent, LLM
+from crewai import Agent
 
-from ..config import AgentRole, get_llm_config, LLMProvider
-from ..tools import FileSystemTool, ShellExecutorTool
+from ..config import AgentRole, get_llm_config
+from .agents.base import BaseCrewForgeAgent, build_llm, clean_prompt
+
+_TASK_BREAKDOWN_INSTRUCTIONS = """Analyze the requirements at the end of this prompt and \
+break them down into specific, actionable development tasks.
+
+For each task, provide:
+1. Task title (clear and concise)
+2. Description (detailed enough for a developer to understand)
+3. Assigned role (architect/developer/reviewer/tester/devops)
+4. Dependencies (which tasks must be completed first)
+5. Estimated complexity (low/medium/high)
+
+Group tasks by phase:
+- Architecture & Design
+- Implementation
+- Testing
+- Deployment
+
+Format the response as a structured list."""
+
+_PROGRESS_CHECK_INSTRUCTIONS = """Review the project progress listed at the end of this prompt.
+
+Analyze:
+1. Are there any blockers or risks?
+2. Should task priorities be adjusted?
+3. Are there any issues that need immediate attention?
+4. What should be the next focus area?
+
+Provide a brief status summary and recommendations."""
+
+_FAILURE_HANDLING_INSTRUCTIONS = """A task has failed and needs attention. The failed task, \
+its error and retry count are given at the end of this prompt.
+
+Analyze the failure and decide:
+1. Can this be fixed by the original agent with different approach?
+2. Should this be reassigned to a different agent?
+3. Are there prerequisite tasks that were missed?
+4. Should the task be broken down further?
+5. Is there a fundamental issue with the requirements?
+
+Provide a recovery plan with specific next steps."""
 
 
 class ManagerAgent:
@@ -22,11 +61,11 @@ class ManagerAgent:
 
     role = AgentRole.MANAGER
     name = "Project Manager"
-    goal = """Orchestrate the software development team to deliver high-quality
+    goal = clean_prompt("""Orchestrate the software development team to deliver high-quality
     software on time. Break down requirements into actionable tasks, assign them
-    to the right team members, monitor progress, and ensure successful delivery."""
+    to the right team members, monitor progress, and ensure successful delivery.""")
 
-    backstory = """You are an experienced technical project manager with a strong
+    backstory = clean_prompt("""You are an experienced technical project manager with a strong
     software engineering background. You have successfully led multiple software
     projects from inception to delivery.
 
@@ -48,7 +87,7 @@ class ManagerAgent:
     - QA Engineer: For testing
     - DevOps Engineer: For deployment and infrastructure
 
-    You delegate effectively but remain accountable for the project's success."""
+    You delegate effectively but remain accountable for the project's success.""")
 
     def __init__(
         self,
@@ -67,6 +106,8 @@ class ManagerAgent:
         self.verbose = verbose
         self._model = model
         self._agent: Optional[Agent] = None
+        self._hierarchical_agent: Optional[Agent] = None
+        self._llm: Optional[Any] = None
 
     @property
     def model(self) -> str:
@@ -78,62 +119,19 @@ class ManagerAgent:
 
     def get_llm(self) -> Any:
         """Get the LLM instance for this agent."""
-        llm_config = get_llm_config()
-        model = self.model  # Already includes provider prefix if needed
-
-        if llm_config.provider == LLMProvider.OPENAI_COMPATIBLE:
-            api_key = llm_config.openai_compatible_api_key or os.getenv("OPENROUTER_API_KEY")
-            base_url = llm_config.openai_compatible_base_url
-
-            return LLM(
-                model=model,
-                base_url=base_url,
-                api_key=api_key,
-            )
-        elif llm_config.provider == LLMProvider.ANTHROPIC:
-            # Support custom base_url for Anthropic proxies
-            if llm_config.anthropic_base_url:
-                return LLM(
-                    model=model,  # No prefix for custom endpoints
-                    base_url=llm_config.anthropic_base_url,
-                    api_key=llm_config.anthropic_api_key,
-                    temperature=llm_config.temperature,
-                    max_tokens=llm_config.max_tokens,
-                )
-            else:
-                return LLM(
-                    model=model,  # get_model_for_role adds anthropic/ prefix
-                    api_key=llm_config.anthropic_api_key,
-                    temperature=llm_config.temperature,
-                    max_tokens=llm_config.max_tokens,
-                )
-        elif llm_config.provider == LLMProvider.OLLAMA:
-            return LLM(
-                model=model,  # get_model_for_role adds ollama/ prefix
-                base_url=llm_config.ollama_base_url,
-            )
-        else:
-            # OpenAI - support custom base_url
-            if llm_config.openai_base_url:
-                # Force openai provider to avoid LiteLLM auto-detecting based on model name
-                # This prevents it from trying to use anthropic SDK for claude models
-                return LLM(
-                    model=f"openai/{model}",
-                    base_url=llm_config.openai_base_url,
-                    api_key=llm_config.openai_api_key,
-                )
+        if self._llm is None:
+            llm_config = get_llm_config()
+            if self._model:
+                model = llm_config.resolve_model(self._model)
             else:
-                return LLM(
-                    model=model,
-                    api_key=llm_config.openai_api_key,
-                )
+                model = llm_config.resolved_model_for(self.role)
+            self._llm = build_llm(llm_config, model)
+        return self._llm
 
     def get_tools(self) -> list:
         """Get manager-specific tools."""
-        return [
-            *FileSystemTool.get_tools(),
-            ShellExecutorTool(),
-        ]
+        # Same tool set as the other agents' base tools, shared rather than rebuilt
+        return BaseCrewForgeAgent.get_base_tools()
 
     def create_agent(self, as_manager: bool = False) -> Agent:
         """Create and return the Manager agent.
@@ -144,15 +142,17 @@ class ManagerAgent:
         """
         # For hierarchical mode, manager_agent cannot have tools
         if as_manager:
-            return Agent(
-                role=self.name,
-                goal=self.goal,
-                backstory=self.backstory,
-                tools=[],  # No tools for hierarchical manager
-                verbose=self.verbose,
-                allow_delegation=True,
-                llm=self.get_llm(),
-            )
+            if self._hierarchical_agent is None:
+                self._hierarchical_agent = Agent(
+                    role=self.name,
+                    goal=self.goal,
+                    backstory=self.backstory,
+                    tools=[],  # No tools for hierarchical manager
+                    verbose=self.verbose,
+                    allow_delegation=True,
+                    llm=self.get_llm(),
+                )
+            return self._hierarchical_agent
 
         if self._agent is None:
             self._agent = Agent(
@@ -169,64 +169,27 @@ class ManagerAgent:
 
     def create_task_breakdown_prompt(self, requirements: str) -> str:
         """Create a prompt for breaking down requirements into tasks."""
-        return f"""Analyze the following requirements and break them down into
-specific, actionable development tasks:
-
-REQUIREMENTS:
-{requirements}
-
-For each task, provide:
-1. Task title (clear and concise)
-2. Description (detailed enough for a developer to understand)
-3. Assigned role (architect/developer/reviewer/tester/devops)
-4. Dependencies (which tasks must be completed first)
-5. Estimated complexity (low/medium/high)
-
-Group tasks by phase:
-- Architecture & Design
-- Implementation
-- Testing
-- Deployment
-
-Format the response as a structured list."""
+        return f"{_TASK_BREAKDOWN_INSTRUCTIONS}\n\nREQUIREMENTS:\n{requirements}"
 
     def create_progress_check_prompt(self, completed_tasks: list, pending_tasks: list) -> str:
         """Create a prompt for checking project progress."""
         completed_str = "\n".join(f"- {t}" for t in completed_tasks) or "None yet"
         pending_str = "\n".join(f"- {t}" for t in pending_tasks) or "None"
 
-        return f"""Review the current project progress:
-
-COMPLETED TASKS:
-{completed_str}
-
-PENDING TASKS:
-{pending_str}
-
-Analyze:
-1. Are there any blockers or risks?
-2. Should task priorities be adjusted?
-3. Are there any issues that need immediate attention?
-4. What should be the next focus area?
-
-Provide a brief status summary and recommendations."""
+        return (
+            f"{_PROGRESS_CHECK_INSTRUCTIONS}\n\n"
+            f"COMPLETED TASKS:\n{completed_str}\n\n"
+            f"PENDING TASKS:\n{pending_str}"
+        )
 
     def create_failure_handling_prompt(self, failed_task: str, error: str, retry_count: int) -> str:
         """Create a prompt for handling task failures."""
-        return f"""A task has failed and needs attention:
-
-FAILED TASK: {failed_task}
-ERROR: {error}
-RETRY COUNT: {retry_count}
-
-Analyze the failure and decide:
-1. Can this be fixed by the original agent with different approach?
-2. Should this be reassigned to a different agent?
-3. Are there prerequisite tasks that were missed?
-4. Should the task be broken down further?
-5. Is there a fundamental issue with the requirements?
-
-Provide a recovery plan with specific next steps."""
+        return (
+            f"{_FAILURE_HANDLING_INSTRUCTIONS}\n\n"
+            f"FAILED TASK: {failed_task}\n"
+            f"ERROR: {error}\n"
+            f"RETRY COUNT: {retry_count}"
+        )
 
     def __repr__(self) -> str:
         return f"<ManagerAgent(model={self.model})>"
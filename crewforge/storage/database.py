@@ -1,14 +1,54 @@
 """Database management for state persistence."""
 
+import os
+import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import Row, create_engine, event, func, insert, select, update
 from sqlalchemy.orm import Session, sessionmaker
 
-from .models import Base, Project, Task, AgentLog, TaskStatus, ProjectStatus
+try:
+    import orjson
+except ImportError:  # Optional: SQLAlchemy falls back to the stdlib json module
+    orjson = None
+
+from .models import Base, Project, Task, AgentLog, LLMResponse, TaskStatus, ProjectStatus
+
+# Bump whenever a table or index is added, so existing SQLite files get it on next open
+_SCHEMA_VERSION = 1
+
+# Session.info keys: how many get_session() blocks are nested inside the one that owns
+# the session, and whether a nested write made the project cache stale
+_NESTING = "crewforge_nesting"
+_PROJECTS_STALE = "crewforge_projects_stale"
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Use WAL journaling so readers don't block the writer, with fewer fsyncs per commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _orjson_dumps(value) -> str:
+    """Serialize a JSON column value with orjson, accepting non-string keys like json does."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _stat_token(path: str) -> Optional[tuple[int, int]]:
+    """Return (mtime, size) for a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 class Database:
@@ -17,25 +57,141 @@ class Database:
     def __init__(self, database_url: str = "sqlite:///crewforge.db"):
         """Initialize database connection."""
         self.database_url = database_url
-        self.engine = create_engine(
-            database_url,
-            echo=False,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
-        )
+        engine_kwargs = {"echo": False}
+        if orjson is not None:
+            engine_kwargs["json_serializer"] = _orjson_dumps
+            engine_kwargs["json_deserializer"] = orjson.loads
+        if "sqlite" in database_url:
+            self.engine = create_engine(
+                database_url,
+                connect_args={"check_same_thread": False},
+                **engine_kwargs,
+            )
+            event.listen(self.engine, "connect", _configure_sqlite_connection)
+        else:
+            # Keep server connections open between the many short sessions below
+            self.engine = create_engine(
+                database_url,
+                pool_size=10,
+                max_overflow=20,
+                pool_timeout=30,
+                pool_recycle=3600,
+                pool_pre_ping=True,
+                **engine_kwargs,
+            )
         self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
+        # Session of the enclosing get_session() block, if any, so nested calls join it
+        self._ambient_session: ContextVar[Optional[Session]] = ContextVar(
+            f"crewforge_session_{id(self)}", default=None
+        )
+        # Project reads are memoized. Writes through this instance clear the cache, and for
+        # file-backed SQLite the stat of the database file and its WAL acts as an ETag for
+        # writes made by other processes.
+        url = self.engine.url
+        is_sqlite_file = url.get_backend_name() == "sqlite" and url.database not in (
+            None, "", ":memory:"
+        )
+        self._db_path: Optional[str] = url.database if is_sqlite_file else None
+        self._cache_token: Optional[tuple] = None
+        self._projects_by_name: dict[str, Project] = {}
+        self._project_list: Optional[list[Project]] = None
 
     def create_tables(self) -> None:
-        """Create all database tables."""
-        Base.metadata.create_all(bind=self.engine)
+        """Create all database tables.
+
+        SQLite files record the schema version they were created with, so reopening an
+        up-to-date file skips the per-table and per-index existence checks.
+        """
+        is_sqlite = self.engine.dialect.name == "sqlite"
+        with self.engine.begin() as conn:
+            if is_sqlite:
+                if conn.exec_driver_sql("PRAGMA user_version").scalar() == _SCHEMA_VERSION:
+                    return
+            Base.metadata.create_all(bind=conn)
+            # create_all skips existing tables entirely, so add indexes introduced later
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+            if is_sqlite:
+                conn.exec_driver_sql(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def drop_tables(self) -> None:
         """Drop all database tables."""
-        Base.metadata.drop_all(bind=self.engine)
+        with self.engine.begin() as conn:
+            Base.metadata.drop_all(bind=conn)
+            if self.engine.dialect.name == "sqlite":
+                conn.exec_driver_sql("PRAGMA user_version = 0")
+        self._invalidate_project_cache()
+
+    def _invalidate_project_cache(self) -> None:
+        """Drop memoized project reads.
+
+        Inside a ``get_session()`` block this is deferred until the block ends, so the
+        cache is never refilled with rows a rollback could still discard.
+        """
+        session = self._ambient_session.get()
+        if session is not None:
+            session.info[_PROJECTS_STALE] = True
+            return
+        self._projects_by_name.clear()
+        self._project_list = None
+
+    @staticmethod
+    def _detach(session: Session, *objects) -> None:
+        """Expunge objects so they stay usable after the session closes.
+
+        Objects loaded through an enclosing ``get_session()`` block are left attached:
+        expunging them would drop the caller's pending changes to the same rows.
+        """
+        if session.info.get(_NESTING):
+            return
+        for obj in objects:
+            session.expunge(obj)
+
+    @staticmethod
+    def _bulk_insert(session: Session, model: type, rows: list[dict]) -> list:
+        """Insert rows and return the created objects in the same order.
+
+        Uses one multi-row INSERT ... RETURNING where the dialect supports it, and
+        ``add_all`` plus a flush elsewhere (e.g. MySQL, MariaDB before 10.5).
+        """
+        if session.get_bind().dialect.insert_returning:
+            stmt = insert(model).returning(model, sort_by_parameter_order=True)
+            return list(session.scalars(stmt, rows).all())
+        objects = [model(**row) for row in rows]
+        session.add_all(objects)
+        session.flush()
+        return objects
+
+    def _check_project_cache(self) -> None:
+        """Invalidate memoized project reads if the SQLite file changed on disk."""
+        if self._db_path is None:
+            return
+        # In WAL mode, commits land in the -wal file until a checkpoint
+        token = (_stat_token(self._db_path), _stat_token(f"{self._db_path}-wal"))
+        if token != self._cache_token:
+            self._invalidate_project_cache()
+            self._cache_token = token
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
-        """Get a database session context manager."""
+        """Get a database session context manager.
+
+        Calls nested inside another ``get_session()`` block reuse its session, so
+        several operations can share one transaction; only the outermost block
+        commits (or rolls back) and closes it.
+        """
+        session = self._ambient_session.get()
+        if session is not None:
+            session.info[_NESTING] = session.info.get(_NESTING, 0) + 1
+            try:
+                yield session
+            finally:
+                session.info[_NESTING] -= 1
+            return
+
         session = self.SessionLocal()
+        token = self._ambient_session.set(session)
         try:
             yield session
             session.commit()
@@ -43,7 +199,10 @@ class Database:
             session.rollback()
             raise
         finally:
+            self._ambient_session.reset(token)
             session.close()
+            if session.info.pop(_PROJECTS_STALE, False):
+                self._invalidate_project_cache()
 
     # Project operations
     def create_project(
@@ -65,58 +224,103 @@ class Database:
             )
             session.add(project)
             session.flush()
-            session.refresh(project)
-            project_id = project.id
-        return self.get_project(project_id)
+            self._detach(session, project)
+        self._invalidate_project_cache()
+        return project
 
     def get_project(self, project_id: int) -> Optional[Project]:
         """Get a project by ID."""
         with self.get_session() as session:
-            project = session.query(Project).filter(Project.id == project_id).first()
+            project = session.get(Project, project_id)
             if project:
-                session.expunge(project)
+                self._detach(session, project)
             return project
 
     def get_project_by_name(self, name: str) -> Optional[Project]:
         """Get a project by name."""
+        # Inside a get_session() block the cache could disagree with the open transaction
+        use_cache = self._ambient_session.get() is None
+        if use_cache:
+            self._check_project_cache()
+            cached = self._projects_by_name.get(name)
+            if cached is not None:
+                return cached
         with self.get_session() as session:
-            project = session.query(Project).filter(Project.name == name).first()
+            project = session.scalars(select(Project).where(Project.name == name).limit(1)).first()
             if project:
-                session.expunge(project)
+                self._detach(session, project)
+                if use_cache:
+                    self._projects_by_name[name] = project
             return project
 
     def update_project_status(self, project_id: int, status: ProjectStatus) -> None:
         """Update project status."""
         with self.get_session() as session:
-            session.query(Project).filter(Project.id == project_id).update({"status": status})
+            session.execute(
+                update(Project).where(Project.id == project_id).values(status=status)
+            )
+        self._invalidate_project_cache()
 
     def update_project_requirements(
-        self, project_id: int, requirements: str, approved: bool = False
+        self,
+        project_id: int,
+        requirements: str,
+        approved: bool = False,
+        status: Optional[ProjectStatus] = None,
     ) -> None:
-        """Update project requirements."""
+        """Update project requirements, optionally setting the status in the same UPDATE."""
+        values = {"requirements": requirements, "requirements_approved": approved}
+        if status is not None:
+            values["status"] = status
         with self.get_session() as session:
-            session.query(Project).filter(Project.id == project_id).update({
-                "requirements": requirements,
-                "requirements_approved": approved,
-            })
+            session.execute(update(Project).where(Project.id == project_id).values(values))
+        self._invalidate_project_cache()
 
     def update_project_architecture(
-        self, project_id: int, architecture: str, approved: bool = False
+        self,
+        project_id: int,
+        architecture: str,
+        approved: bool = False,
+        status: Optional[ProjectStatus] = None,
     ) -> None:
-        """Update project architecture."""
+        """Update project architecture, optionally setting the status in the same UPDATE."""
+        values = {"architecture": architecture, "architecture_approved": approved}
+        if status is not None:
+            values["status"] = status
         with self.get_session() as session:
-            session.query(Project).filter(Project.id == project_id).update({
-                "architecture": architecture,
-                "architecture_approved": approved,
-            })
+            session.execute(update(Project).where(Project.id == project_id).values(values))
+        self._invalidate_project_cache()
 
     def list_projects(self) -> list[Project]:
         """List all projects."""
+        use_cache = self._ambient_session.get() is None
+        if use_cache:
+            self._check_project_cache()
+            if self._project_list is not None:
+                return list(self._project_list)
+        with self.get_session() as session:
+            projects = session.scalars(select(Project)).all()
+            self._detach(session, *projects)
+        if use_cache:
+            self._project_list = projects
+        return list(projects)
+
+    def list_project_summaries(self) -> list[Row]:
+        """List projects with only the columns listings need.
+
+        Rows have ``id``, ``name``, ``status``, ``git_repo_path`` and ``created_at``,
+        skipping the requirements/architecture text and JSON config columns.
+        """
         with self.get_session() as session:
-            projects = session.query(Project).all()
-            for p in projects:
-                session.expunge(p)
-            return projects
+            return session.execute(
+                select(
+                    Project.id,
+                    Project.name,
+                    Project.status,
+                    Project.git_repo_path,
+                    Project.created_at,
+                )
+            ).all()
 
     # Task operations
     def create_task(
@@ -140,16 +344,39 @@ class Database:
             )
             session.add(task)
             session.flush()
-            session.refresh(task)
-            task_id = task.id
-        return self.get_task(task_id)
+            self._detach(session, task)
+        return task
+
+    def bulk_create_tasks(self, project_id: int, tasks: list[dict]) -> list[Task]:
+        """Create several tasks with one multi-row INSERT ... RETURNING.
+
+        Each entry is a dict with optional ``title``, ``description``, ``task_type``,
+        ``assigned_agent`` and ``parent_task_id`` keys.
+        """
+        if not tasks:
+            return []
+        rows = [
+            {
+                "project_id": project_id,
+                "title": task.get("title", "Untitled"),
+                "description": task.get("description", ""),
+                "task_type": task.get("task_type"),
+                "assigned_agent": task.get("assigned_agent"),
+                "parent_task_id": task.get("parent_task_id"),
+            }
+            for task in tasks
+        ]
+        with self.get_session() as session:
+            created = self._bulk_insert(session, Task, rows)
+            self._detach(session, *created)
+        return list(created)
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID."""
         with self.get_session() as session:
-            task = session.query(Task).filter(Task.id == task_id).first()
+            task = session.get(Task, task_id)
             if task:
-                session.expunge(task)
+                self._detach(session, task)
             return task
 
     def update_task_status(
@@ -160,8 +387,6 @@ class Database:
         error_message: Optional[str] = None,
     ) -> None:
         """Update task status."""
-        from datetime import datetime
-
         updates = {"status": status}
         if status == TaskStatus.IN_PROGRESS:
             updates["started_at"] = datetime.utcnow()
@@ -173,39 +398,59 @@ class Database:
             updates["error_message"] = error_message
 
         with self.get_session() as session:
-            session.query(Task).filter(Task.id == task_id).update(updates)
+            session.execute(update(Task).where(Task.id == task_id).values(updates))
 
     def increment_task_retry(self, task_id: int) -> int:
-        """Increment task retry count and return new count."""
+        """Increment task retry count and return new count (0 if the task doesn't exist)."""
+        # Increment in SQL so concurrent retries can't both read the same old count
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(retry_count=Task.retry_count + 1, status=TaskStatus.RETRYING)
+        )
         with self.get_session() as session:
-            task = session.query(Task).filter(Task.id == task_id).first()
-            if task:
-                task.retry_count += 1
-                task.status = TaskStatus.RETRYING
-                session.flush()
-                return task.retry_count
-            return 0
+            if session.get_bind().dialect.update_returning:
+                new_count = session.execute(stmt.returning(Task.retry_count)).scalar_one_or_none()
+            else:
+                session.execute(stmt)
+                new_count = session.execute(
+                    select(Task.retry_count).where(Task.id == task_id)
+                ).scalar_one_or_none()
+        return new_count or 0
 
     def get_pending_tasks(self, project_id: int) -> list[Task]:
         """Get all pending tasks for a project."""
         with self.get_session() as session:
-            tasks = (
-                session.query(Task)
-                .filter(Task.project_id == project_id, Task.status == TaskStatus.PENDING)
-                .all()
-            )
-            for t in tasks:
-                session.expunge(t)
+            tasks = session.scalars(
+                select(Task).where(
+                    Task.project_id == project_id, Task.status == TaskStatus.PENDING
+                )
+            ).all()
+            self._detach(session, *tasks)
             return tasks
 
     def get_project_tasks(self, project_id: int) -> list[Task]:
         """Get all tasks for a project."""
         with self.get_session() as session:
-            tasks = session.query(Task).filter(Task.project_id == project_id).all()
-            for t in tasks:
-                session.expunge(t)
+            tasks = session.scalars(select(Task).where(Task.project_id == project_id)).all()
+            self._detach(session, *tasks)
             return tasks
 
+    def get_task_status_counts(self, project_ids: list[int]) -> dict[int, dict[TaskStatus, int]]:
+        """Count tasks per status for each project with a single GROUP BY query."""
+        counts: dict[int, dict[TaskStatus, int]] = {pid: {} for pid in project_ids}
+        if not project_ids:
+            return counts
+        with self.get_session() as session:
+            rows = session.execute(
+                select(Task.project_id, Task.status, func.count(Task.id))
+                .where(Task.project_id.in_(project_ids))
+                .group_by(Task.project_id, Task.status)
+            ).all()
+        for project_id, status, count in rows:
+            counts[project_id][status] = count
+        return counts
+
     # Agent log operations
     def add_agent_log(
         self,
@@ -228,43 +473,112 @@ class Database:
             )
             session.add(log)
             session.flush()
-            session.refresh(log)
-            log_id = log.id
-        return self.get_agent_log(log_id)
+            self._detach(session, log)
+        return log
+
+    def bulk_add_agent_logs(self, logs: list[dict]) -> list[AgentLog]:
+        """Add several agent log entries with one multi-row INSERT ... RETURNING.
+
+        Each entry takes the keyword arguments of ``add_agent_log``.
+        """
+        if not logs:
+            return []
+        rows = [
+            {
+                "task_id": log["task_id"],
+                "agent_role": log["agent_role"],
+                "action": log["action"],
+                "message": log.get("message"),
+                "details": log.get("details"),
+                "level": log.get("level", "INFO"),
+            }
+            for log in logs
+        ]
+        with self.get_session() as session:
+            created = self._bulk_insert(session, AgentLog, rows)
+            self._detach(session, *created)
+        return list(created)
 
     def get_agent_log(self, log_id: int) -> Optional[AgentLog]:
         """Get an agent log by ID."""
         with self.get_session() as session:
-            log = session.query(AgentLog).filter(AgentLog.id == log_id).first()
+            log = session.get(AgentLog, log_id)
             if log:
-                session.expunge(log)
+                self._detach(session, log)
             return log
 
     def get_task_logs(self, task_id: int) -> list[AgentLog]:
         """Get all logs for a task."""
         with self.get_session() as session:
-            logs = session.query(AgentLog).filter(AgentLog.task_id == task_id).all()
-            for log in logs:
-                session.expunge(log)
+            logs = session.scalars(select(AgentLog).where(AgentLog.task_id == task_id)).all()
+            self._detach(session, *logs)
             return logs
 
+    def get_project_logs(self, project_id: int, level: Optional[str] = None) -> list[AgentLog]:
+        """Get all logs for a project's tasks in one query, oldest first."""
+        with self.get_session() as session:
+            stmt = (
+                select(AgentLog)
+                .join(Task, Task.id == AgentLog.task_id)
+                .where(Task.project_id == project_id)
+            )
+            if level:
+                stmt = stmt.where(AgentLog.level == level)
+            logs = session.scalars(stmt.order_by(AgentLog.created_at, AgentLog.id)).all()
+            self._detach(session, *logs)
+            return logs
+
+    # LLM response cache operations
+    def get_cached_response(self, key: str) -> Optional[str]:
+        """Get a cached LLM response, or None if missing or expired."""
+        with self.get_session() as session:
+            entry = session.get(LLMResponse, key)
+            if entry is None:
+                return None
+            if entry.ttl_seconds is not None and (
+                datetime.utcnow() - entry.created_at > timedelta(seconds=entry.ttl_seconds)
+            ):
+                session.delete(entry)
+                return None
+            return entry.response
+
+    def set_cached_response(self, key: str, response: str, ttl: Optional[int] = None) -> None:
+        """Store an LLM response, replacing any previous entry for the key."""
+        with self.get_session() as session:
+            session.merge(
+                LLMResponse(
+                    key=key,
+                    response=response,
+                    ttl_seconds=ttl,
+                    created_at=datetime.utcnow(),
+                )
+            )
+
 
 _database: Optional[Database] = None
+_database_lock = threading.Lock()
 
 
 def get_database(database_url: Optional[str] = None) -> Database:
     """Get or create database instance."""
     global _database
     if _database is None:
-        from ..config import get_settings
-
-        url = database_url or get_settings().database_url
-        _database = Database(url)
-        _database.create_tables()
+        # Double-checked so concurrent first calls build a single engine and pool
+        with _database_lock:
+            if _database is None:
+                from ..config import get_settings
+
+                url = database_url or get_settings().database_url
+                database = Database(url)
+                database.create_tables()
+                _database = database
     return _database
 
 
 def reset_database() -> None:
-    """Reset the global database instance."""
+    """Reset the global database instance, closing its pooled connections."""
     global _database
-    _database = None
+    with _database_lock:
+        if _database is not None:
+            _database.engine.dispose()
+        _database = None
@@ -9,12 +9,14 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     JSON,
     Boolean,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -24,6 +26,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# Binary JSONB on PostgreSQL (no re-parse on read); plain JSON elsewhere
+_JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 class TaskStatus(str, Enum):
     """Task execution status."""
 
@@ -57,13 +63,13 @@ class Project(Base):
     __tablename__ = "projects"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(SQLEnum(ProjectStatus), default=ProjectStatus.INITIALIZING)
 
     # Configuration
-    config = Column(JSON, nullable=True)  # Stores project.yaml content
-    tech_stack = Column(JSON, nullable=True)
+    config = Column(_JSONType, nullable=True)  # Stores project.yaml content
+    tech_stack = Column(_JSONType, nullable=True)
 
     # Git info
     git_repo_path = Column(String(512), nullable=True)
@@ -88,6 +94,10 @@ class Task(Base):
     """Task model for tracking individual tasks."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_parent", "parent_task_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -130,6 +140,7 @@ class AgentLog(Base):
     """Log entries for agent actions."""
 
     __tablename__ = "agent_logs"
+    __table_args__ = (Index("ix_logs_task_created", "task_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
@@ -138,7 +149,7 @@ class AgentLog(Base):
     agent_role = Column(String(100), nullable=False)
     action = Column(String(255), nullable=False)
     message = Column(Text, nullable=True)
-    details = Column(JSON, nullable=True)
+    details = Column(_JSONType, nullable=True)
 
     # Logging level
     level = Column(String(20), default="INFO")  # DEBUG, INFO, WARNING, ERROR
@@ -166,3 +177,16 @@ class FileChange(Base):
 
     # Timestamp
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class LLMResponse(Base):
+    """Cached crew output, keyed by a hash of the model and prompt."""
+
+    __tablename__ = "llm_response_cache"
+
+    key = Column(String(64), primary_key=True)
+    response = Column(Text, nullable=False)
+    ttl_seconds = Column(Integer, nullable=True)  # None means the entry never expires
+
+    # Timestamp
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -4,7 +4,7 @@ from .filesystem import FileSystemTool, ReadFileTool, WriteFileTool, ListDirecto
 from .shell import ShellExecutorTool
 from .git import GitTool
 from .browser import BrowserTool
-from .search import WebSearchTool
+from .search import CodeSearchTool, MultiCodeSearchTool, WebSearchTool
 from .openspec import (
     OpenSpecWriterTool,
     OpenSpecReaderTool,
@@ -21,6 +21,8 @@ __all__ = [
     "GitTool",
     "BrowserTool",
     "WebSearchTool",
+    "CodeSearchTool",
+    "MultiCodeSearchTool",
     "OpenSpecWriterTool",
     "OpenSpecReaderTool",
     "OpenSpecUpdateTool",
@@ -0,0 +1,137 @@
+"""In-process result caches for tools that call remote services."""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being set.
+
+    Holds at most ``maxsize`` entries; the oldest are dropped first.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entries beyond maxsize."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+def cached(
+    cache: TTLCache,
+    fields: tuple[str, ...] = (),
+    cache_if: Optional[Callable[[Any], bool]] = None,
+) -> Callable:
+    """Memoize a tool method (sync or async) in ``cache``.
+
+    The key is the named instance ``fields`` (configuration that changes the
+    result, such as an API key) plus the call arguments with defaults applied,
+    so positional, keyword and defaulted calls share entries. Results for which
+    ``cache_if`` returns False, such as error messages, are not stored.
+
+    Concurrent calls with the same key share one underlying call instead of
+    each missing the cache and issuing its own request.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        # Calls currently running, per key (and per event loop for async calls)
+        in_flight: dict[Hashable, Any] = {}
+        in_flight_lock = threading.Lock()
+
+        def make_key(self, args: tuple, kwargs: dict) -> Hashable:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            config = tuple(getattr(self, name) for name in fields)
+            return (config, tuple(bound.arguments.values())[1:])
+
+        def store(key: Hashable, result: Any) -> None:
+            if cache_if is None or cache_if(result):
+                cache.set(key, result)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = make_key(self, args, kwargs)
+                result = cache.get(key)
+                if result is not None:
+                    return result
+
+                loop = asyncio.get_running_loop()
+                flight_key = (loop, key)
+                task = in_flight.get(flight_key)
+                if task is None:
+                    task = loop.create_task(func(self, *args, **kwargs))
+                    in_flight[flight_key] = task
+
+                    def finish(done: asyncio.Task) -> None:
+                        in_flight.pop(flight_key, None)
+                        if not done.cancelled() and done.exception() is None:
+                            store(key, done.result())
+
+                    task.add_done_callback(finish)
+                # Shielded so one caller being cancelled doesn't cancel the others
+                return await asyncio.shield(task)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(self, args, kwargs)
+            with in_flight_lock:
+                result = cache.get(key)
+                if result is not None:
+                    return result
+                pending = in_flight.get(key)
+                if pending is None:
+                    future = in_flight[key] = Future()
+            if pending is not None:
+                return pending.result()
+
+            try:
+                result = func(self, *args, **kwargs)
+                store(key, result)
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with in_flight_lock:
+                    del in_flight[key]
+
+        return wrapper
+
+    return decorator
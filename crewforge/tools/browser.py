@@ -1,7 +1,10 @@
 """Browser automation tool using Playwright."""
 
 import asyncio
-from typing import Optional, Type
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, Optional, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -15,6 +18,54 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+# Launching Chromium takes seconds, so each thread keeps one headless browser while
+# it runs and every tool call gets a fresh context (cookies, storage) on it.
+# Playwright's sync API objects are bound to the thread that created them, hence
+# thread-local rather than module-global.
+_local = threading.local()
+
+
+class _ThreadBrowser:
+    """A thread's Playwright driver and browser, stopped once the thread is gone."""
+
+    __slots__ = ("playwright", "browser", "__weakref__")
+
+    def __init__(self, playwright) -> None:
+        self.playwright = playwright
+        self.browser: Optional["Browser"] = None
+        # Runs when the thread exits and its locals are dropped, so short-lived
+        # worker threads don't each leave a Chromium behind; also at interpreter exit
+        weakref.finalize(self, _close_browser, playwright)
+
+
+def _get_browser() -> "Browser":
+    """Return this thread's shared headless Chromium, launching it on first use."""
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _local.holder = _ThreadBrowser(sync_playwright().start())
+    if holder.browser is None or not holder.browser.is_connected():
+        holder.browser = holder.playwright.chromium.launch(headless=True)
+    return holder.browser
+
+
+def _close_browser(playwright) -> None:
+    """Stop a thread's Playwright driver, which also closes its browser."""
+    try:
+        playwright.stop()
+    except Exception:
+        pass  # Driver already gone, or owned by another thread
+
+
+@contextmanager
+def _new_page() -> Iterator["Page"]:
+    """Open a page in a fresh, isolated context on the shared browser."""
+    context = _get_browser().new_context()
+    try:
+        yield context.new_page()
+    finally:
+        context.close()
+
+
 class BrowserNavigateInput(BaseModel):
     """Input schema for browser navigation."""
 
@@ -47,10 +98,7 @@ class BrowserNavigateTool(BaseTool):
             return "Error: Playwright is not installed. Run 'pip install playwright && playwright install'"
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with _new_page() as page:
                 # Navigate
                 page.goto(url, wait_until=wait_for)
 
@@ -62,8 +110,6 @@ class BrowserNavigateTool(BaseTool):
                 if screenshot_path:
                     page.screenshot(path=screenshot_path)
 
-                browser.close()
-
                 result = f"Navigated to: {current_url}\nTitle: {title}"
                 if screenshot_path:
                     result += f"\nScreenshot saved to: {screenshot_path}"
@@ -96,16 +142,12 @@ class BrowserClickTool(BaseTool):
             return "Error: Playwright is not installed."
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with _new_page() as page:
                 page.goto(url, wait_until="networkidle")
                 page.click(selector)
                 page.wait_for_timeout(wait_after)
 
                 new_url = page.url
-                browser.close()
 
                 return f"Clicked element '{selector}'. Current URL: {new_url}"
 
@@ -134,15 +176,10 @@ class BrowserFillTool(BaseTool):
             return "Error: Playwright is not installed."
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with _new_page() as page:
                 page.goto(url, wait_until="networkidle")
                 page.fill(selector, value)
 
-                browser.close()
-
                 return f"Filled '{selector}' with value."
 
         except Exception as e:
@@ -171,10 +208,7 @@ class BrowserGetContentTool(BaseTool):
             return "Error: Playwright is not installed."
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with _new_page() as page:
                 page.goto(url, wait_until="networkidle")
 
                 if selector:
@@ -186,8 +220,6 @@ class BrowserGetContentTool(BaseTool):
                 else:
                     content = page.inner_text("body")
 
-                browser.close()
-
                 # Truncate if too long
                 if len(content) > 5000:
                     content = content[:5000] + "\n... (truncated)"
@@ -212,6 +244,58 @@ class BrowserTestInput(BaseModel):
     )
 
 
+def _step_navigate(page: "Page", step: dict, i: int) -> str:
+    value = step.get("value")
+    page.goto(value, wait_until="networkidle")
+    return f"✓ Step {i}: Navigated to {value}"
+
+
+def _step_click(page: "Page", step: dict, i: int) -> str:
+    selector = step.get("selector")
+    page.click(selector)
+    return f"✓ Step {i}: Clicked {selector}"
+
+
+def _step_fill(page: "Page", step: dict, i: int) -> str:
+    selector = step.get("selector")
+    page.fill(selector, step.get("value"))
+    return f"✓ Step {i}: Filled {selector}"
+
+
+def _step_assert_text(page: "Page", step: dict, i: int) -> str:
+    selector, value = step.get("selector"), step.get("value")
+    element = page.query_selector(selector)
+    if not element:
+        return f"✗ Step {i}: Element {selector} not found"
+    if value in element.inner_text():
+        return f"✓ Step {i}: Found text '{value}' in {selector}"
+    return f"✗ Step {i}: Text '{value}' not found in {selector}"
+
+
+def _step_assert_visible(page: "Page", step: dict, i: int) -> str:
+    selector = step.get("selector")
+    if page.is_visible(selector):
+        return f"✓ Step {i}: Element {selector} is visible"
+    return f"✗ Step {i}: Element {selector} not visible"
+
+
+def _step_screenshot(page: "Page", step: dict, i: int) -> str:
+    path = step.get("path", f"screenshot_{i}.png")
+    page.screenshot(path=path)
+    return f"✓ Step {i}: Screenshot saved to {path}"
+
+
+# BrowserTestTool step handlers by action name; each returns the step's result line
+_TEST_STEP_ACTIONS = {
+    "navigate": _step_navigate,
+    "click": _step_click,
+    "fill": _step_fill,
+    "assert_text": _step_assert_text,
+    "assert_visible": _step_assert_visible,
+    "screenshot": _step_screenshot,
+}
+
+
 class BrowserTestTool(BaseTool):
     """Tool to run a sequence of browser test steps."""
 
@@ -228,91 +312,49 @@ class BrowserTestTool(BaseTool):
         results = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with _new_page() as page:
                 # Initial navigation
                 page.goto(url, wait_until="networkidle")
                 results.append(f"✓ Navigated to {url}")
 
                 for i, step in enumerate(test_steps, 1):
                     action = step.get("action")
-                    selector = step.get("selector")
-                    value = step.get("value")
+                    handler = _TEST_STEP_ACTIONS.get(action)
+                    if handler is None:
+                        results.append(f"? Step {i}: Unknown action '{action}'")
+                        continue
 
                     try:
-                        if action == "navigate":
-                            page.goto(value, wait_until="networkidle")
-                            results.append(f"✓ Step {i}: Navigated to {value}")
-
-                        elif action == "click":
-                            page.click(selector)
-                            results.append(f"✓ Step {i}: Clicked {selector}")
-
-                        elif action == "fill":
-                            page.fill(selector, value)
-                            results.append(f"✓ Step {i}: Filled {selector}")
-
-                        elif action == "assert_text":
-                            element = page.query_selector(selector)
-                            if element:
-                                text = element.inner_text()
-                                if value in text:
-                                    results.append(
-                                        f"✓ Step {i}: Found text '{value}' in {selector}"
-                                    )
-                                else:
-                                    results.append(
-                                        f"✗ Step {i}: Text '{value}' not found in {selector}"
-                                    )
-                            else:
-                                results.append(
-                                    f"✗ Step {i}: Element {selector} not found"
-                                )
-
-                        elif action == "assert_visible":
-                            if page.is_visible(selector):
-                                results.append(
-                                    f"✓ Step {i}: Element {selector} is visible"
-                                )
-                            else:
-                                results.append(
-                                    f"✗ Step {i}: Element {selector} not visible"
-                                )
-
-                        elif action == "screenshot":
-                            path = step.get("path", f"screenshot_{i}.png")
-                            page.screenshot(path=path)
-                            results.append(f"✓ Step {i}: Screenshot saved to {path}")
-
-                        else:
-                            results.append(f"? Step {i}: Unknown action '{action}'")
-
+                        results.append(handler(page, step, i))
                     except Exception as e:
                         results.append(f"✗ Step {i}: Error - {str(e)}")
 
-                browser.close()
-
         except Exception as e:
             results.append(f"✗ Browser error: {str(e)}")
 
         return "\n".join(results)
 
 
+# Shared tool instances, built on first use (see FileSystemTool.get_tools)
+_BROWSER_TOOLS: Optional[tuple[BaseTool, ...]] = None
+
+
 class BrowserTool:
     """Collection of browser automation tools."""
 
     @staticmethod
     def get_tools() -> list[BaseTool]:
         """Get all browser tools."""
-        return [
-            BrowserNavigateTool(),
-            BrowserClickTool(),
-            BrowserFillTool(),
-            BrowserGetContentTool(),
-            BrowserTestTool(),
-        ]
+        global _BROWSER_TOOLS
+        if _BROWSER_TOOLS is None:
+            _BROWSER_TOOLS = (
+                BrowserNavigateTool(),
+                BrowserClickTool(),
+                BrowserFillTool(),
+                BrowserGetContentTool(),
+                BrowserTestTool(),
+            )
+        return list(_BROWSER_TOOLS)
 
     @staticmethod
     def install_browsers() -> str:
@@ -1,5 +1,9 @@
 """File system tools for agents."""
 
+import asyncio
+import os
+import re
+from fnmatch import translate
 from pathlib import Path
 from typing import Optional, Type
 
@@ -22,16 +26,27 @@ class ReadFileTool(BaseTool):
 
     def _run(self, file_path: str) -> str:
         """Read file contents."""
+        # Open directly and map the failure, rather than stat-ing the path first
         try:
-            path = Path(file_path)
-            if not path.exists():
-                return f"Error: File '{file_path}' does not exist."
-            if not path.is_file():
-                return f"Error: '{file_path}' is not a file."
-            return path.read_text(encoding="utf-8")
+            with open(file_path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return f"Error: File '{file_path}' does not exist."
+        except IsADirectoryError:
+            return f"Error: '{file_path}' is not a file."
         except Exception as e:
+            if os.path.isdir(file_path):  # Windows reports directories as PermissionError
+                return f"Error: '{file_path}' is not a file."
             return f"Error reading file: {str(e)}"
 
+    async def _arun(self, file_path: str) -> str:
+        """Read file contents without blocking the event loop.
+
+        The whole read runs in one worker thread; awaiting each I/O step
+        separately (as aiofiles does) costs a thread hop per call.
+        """
+        return await asyncio.to_thread(self._run, file_path)
+
 
 class WriteFileInput(BaseModel):
     """Input schema for writing a file."""
@@ -54,13 +69,23 @@ class WriteFileTool(BaseTool):
         """Write content to file."""
         try:
             path = Path(file_path)
-            if create_dirs:
+            # Only create parent directories once a write shows they are missing,
+            # so repeated writes into an existing tree issue no mkdir calls
+            try:
+                path.write_text(content, encoding="utf-8")
+            except FileNotFoundError:
+                if not create_dirs:
+                    raise
                 path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+                path.write_text(content, encoding="utf-8")
             return f"Successfully wrote to '{file_path}'"
         except Exception as e:
             return f"Error writing file: {str(e)}"
 
+    async def _arun(self, file_path: str, content: str, create_dirs: bool = True) -> str:
+        """Write content to file in one worker thread."""
+        return await asyncio.to_thread(self._run, file_path, content, create_dirs)
+
 
 class ListDirectoryInput(BaseModel):
     """Input schema for listing directory contents."""
@@ -70,6 +95,10 @@ class ListDirectoryInput(BaseModel):
     pattern: str = Field(default="*", description="Glob pattern to filter files")
 
 
+_DIR_PREFIX = "[DIR]  "
+_FILE_PREFIX = "[FILE] "
+
+
 class ListDirectoryTool(BaseTool):
     """Tool to list directory contents."""
 
@@ -82,30 +111,80 @@ class ListDirectoryTool(BaseTool):
     ) -> str:
         """List directory contents."""
         try:
-            path = Path(directory_path)
-            if not path.exists():
-                return f"Error: Directory '{directory_path}' does not exist."
-            if not path.is_dir():
-                return f"Error: '{directory_path}' is not a directory."
-
-            if recursive:
-                items = list(path.rglob(pattern))
+            if _is_name_pattern(pattern):
+                matches = _scan_directory(directory_path, pattern, recursive)
             else:
-                items = list(path.glob(pattern))
+                matches = _glob_directory(directory_path, pattern, recursive)
 
-            result = []
-            for item in sorted(items):
-                relative = item.relative_to(path)
-                prefix = "[DIR] " if item.is_dir() else "[FILE]"
-                result.append(f"{prefix} {relative}")
+            # Parts are plain names, so joining with os.sep matches os.path.join
+            # without its per-call overhead
+            sep = os.sep
+            result = [
+                (_DIR_PREFIX if is_dir else _FILE_PREFIX) + sep.join(parts)
+                for parts, is_dir in matches
+            ]
 
             if not result:
                 return f"No items found in '{directory_path}'"
             return "\n".join(result)
+        except FileNotFoundError:
+            return f"Error: Directory '{directory_path}' does not exist."
+        except NotADirectoryError:
+            return f"Error: '{directory_path}' is not a directory."
         except Exception as e:
             return f"Error listing directory: {str(e)}"
 
 
+def _is_name_pattern(pattern: str) -> bool:
+    """Whether a glob pattern only matches single path components."""
+    return "**" not in pattern and "/" not in pattern and os.sep not in pattern
+
+
+def _scan_directory(
+    directory_path: str, pattern: str, recursive: bool
+) -> list[tuple[tuple[str, ...], bool]]:
+    """Return sorted (relative path parts, is_dir) for entries whose name matches pattern.
+
+    Walks with os.scandir, whose entries carry their type from the directory read,
+    instead of building a Path and calling stat() for every item.
+    """
+    # Compile the pattern once; fnmatch() would normcase and look it up per entry.
+    # Like fnmatch, matching is case-insensitive only on Windows.
+    matcher = re.compile(translate(pattern), re.IGNORECASE if os.name == "nt" else 0).match
+    matches = []
+    stack = [(directory_path, ())]
+    while stack:
+        directory, parts = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            if not parts:
+                raise  # Report problems with the requested directory itself
+            continue  # Like rglob, skip subdirectories that can't be read
+        with entries:
+            for entry in entries:
+                entry_parts = parts + (entry.name,)
+                if matcher(entry.name):
+                    matches.append((entry_parts, entry.is_dir()))
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, entry_parts))
+    matches.sort()
+    return matches
+
+
+def _glob_directory(
+    directory_path: str, pattern: str, recursive: bool
+) -> list[tuple[tuple[str, ...], bool]]:
+    """Fallback for patterns with path separators or ``**``, using pathlib globbing."""
+    path = Path(directory_path)
+    if not path.exists():
+        raise FileNotFoundError(directory_path)
+    if not path.is_dir():
+        raise NotADirectoryError(directory_path)
+    items = path.rglob(pattern) if recursive else path.glob(pattern)
+    return sorted((item.relative_to(path).parts, item.is_dir()) for item in items)
+
+
 class CreateDirectoryInput(BaseModel):
     """Input schema for creating a directory."""
 
@@ -145,27 +224,35 @@ class DeleteFileTool(BaseTool):
     def _run(self, file_path: str) -> str:
         """Delete file."""
         try:
-            path = Path(file_path)
-            if not path.exists():
-                return f"Error: File '{file_path}' does not exist."
-            if path.is_dir():
-                return f"Error: '{file_path}' is a directory. Use delete_directory instead."
-            path.unlink()
+            os.unlink(file_path)
             return f"Successfully deleted '{file_path}'"
+        except FileNotFoundError:
+            return f"Error: File '{file_path}' does not exist."
         except Exception as e:
+            # Linux raises IsADirectoryError for directories, macOS PermissionError
+            if os.path.isdir(file_path):
+                return f"Error: '{file_path}' is a directory. Use delete_directory instead."
             return f"Error deleting file: {str(e)}"
 
 
+# The tools hold no per-call state, so one set of instances is built on first
+# use and shared; callers get their own list so they can extend it freely.
+_FS_TOOLS: Optional[tuple[BaseTool, ...]] = None
+
+
 class FileSystemTool:
     """Collection of filesystem tools."""
 
     @staticmethod
     def get_tools() -> list[BaseTool]:
         """Get all filesystem tools."""
-        return [
-            ReadFileTool(),
-            WriteFileTool(),
-            ListDirectoryTool(),
-            CreateDirectoryTool(),
-            DeleteFileTool(),
-        ]
+        global _FS_TOOLS
+        if _FS_TOOLS is None:
+            _FS_TOOLS = (
+                ReadFileTool(),
+                WriteFileTool(),
+                ListDirectoryTool(),
+                CreateDirectoryTool(),
+                DeleteFileTool(),
+            )
+        return list(_FS_TOOLS)
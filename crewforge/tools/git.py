@@ -1,17 +1,61 @@
 """Git operations tool for agents."""
 
+import threading
+from collections import OrderedDict
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-try:
-    from git import Repo, InvalidGitRepositoryError, GitCommandError
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
-    Repo = None
+# GitPython is imported on first use by _import_git(), so loading the tools does
+# not pay for it; until then only its presence is checked.
+GIT_AVAILABLE = find_spec("git") is not None
+Repo = Head = InvalidGitRepositoryError = GitCommandError = None
+
+
+def _import_git() -> bool:
+    """Import GitPython once, binding its names in this module. Returns availability."""
+    global GIT_AVAILABLE, Repo, Head, InvalidGitRepositoryError, GitCommandError
+    if Repo is None and GIT_AVAILABLE:
+        try:
+            from git import GitCommandError, Head, InvalidGitRepositoryError, Repo
+        except ImportError:  # Also raised when the git executable is missing
+            GIT_AVAILABLE = False
+    return GIT_AVAILABLE
+
+
+_REPO_CACHE_SIZE = 32
+_repo_cache: "OrderedDict[str, Repo]" = OrderedDict()
+_repo_cache_lock = threading.Lock()
+
+
+def _repo_key(repo_path: str) -> str:
+    return str(Path(repo_path).resolve())
+
+
+def _open_repo(repo_path: str) -> "Repo":
+    """Return a shared Repo for repo_path, keyed on its resolved absolute path.
+
+    Opening a Repo re-reads .git/config and the refs, so agents issuing many git
+    calls against the same project reuse one instance instead.
+    """
+    key = _repo_key(repo_path)
+    with _repo_cache_lock:
+        repo = _repo_cache.get(key)
+        if repo is not None:
+            _repo_cache.move_to_end(key)
+            return repo
+    opened = Repo(key)
+    with _repo_cache_lock:
+        repo = _repo_cache.setdefault(key, opened)
+        while len(_repo_cache) > _REPO_CACHE_SIZE:
+            _, evicted = _repo_cache.popitem(last=False)
+            evicted.close()
+    if repo is not opened:
+        opened.close()  # Another thread cached one first
+    return repo
 
 
 class GitInitInput(BaseModel):
@@ -30,13 +74,14 @@ class GitInitTool(BaseTool):
 
     def _run(self, repo_path: str, initial_branch: str = "main") -> str:
         """Initialize git repository."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
             path = Path(repo_path)
             path.mkdir(parents=True, exist_ok=True)
-            repo = Repo.init(path, initial_branch=initial_branch)
+            Repo.init(path, initial_branch=initial_branch)
+            GitTool.invalidate(repo_path)
             return f"Initialized git repository at '{repo_path}' with branch '{initial_branch}'"
         except Exception as e:
             return f"Error initializing repository: {str(e)}"
@@ -59,19 +104,20 @@ class GitCommitTool(BaseTool):
 
     def _run(self, repo_path: str, message: str, add_all: bool = True) -> str:
         """Commit changes."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
+
+            # Check if there are changes to commit, with one status call instead of
+            # separate dirty and untracked queries
+            if not repo.git.status("--porcelain", "-z", untracked_files="all"):
+                return "No changes to commit."
 
             if add_all:
                 repo.git.add(A=True)
 
-            # Check if there are changes to commit
-            if not repo.is_dirty() and not repo.untracked_files:
-                return "No changes to commit."
-
             commit = repo.index.commit(message)
             return f"Committed: {commit.hexsha[:8]} - {message}"
         except InvalidGitRepositoryError:
@@ -97,14 +143,15 @@ class GitCreateBranchTool(BaseTool):
 
     def _run(self, repo_path: str, branch_name: str, checkout: bool = True) -> str:
         """Create branch."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
 
-            # Check if branch exists
-            if branch_name in [b.name for b in repo.branches]:
+            # Check if branch exists by resolving its ref directly, rather than
+            # listing every branch in the repository
+            if Head(repo, Head.to_full_path(branch_name)).is_valid():
                 if checkout:
                     repo.git.checkout(branch_name)
                     return f"Branch '{branch_name}' already exists. Checked out."
@@ -139,11 +186,11 @@ class GitCheckoutTool(BaseTool):
 
     def _run(self, repo_path: str, branch_name: str) -> str:
         """Checkout branch."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
             repo.git.checkout(branch_name)
             return f"Checked out branch '{branch_name}'"
         except InvalidGitRepositoryError:
@@ -171,11 +218,11 @@ class GitMergeTool(BaseTool):
         self, repo_path: str, source_branch: str, target_branch: str = "main"
     ) -> str:
         """Merge branches."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
 
             # Checkout target branch
             repo.git.checkout(target_branch)
@@ -207,33 +254,31 @@ class GitStatusTool(BaseTool):
 
     def _run(self, repo_path: str) -> str:
         """Get git status."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
+            # One porcelain call instead of separate branch, diff and untracked queries
+            output = repo.git.status("--porcelain=v2", "--branch", "-z", untracked_files="all")
+            branch, modified, staged, untracked = _parse_porcelain_status(output)
 
-            status_parts = []
-            status_parts.append(f"Current branch: {repo.active_branch.name}")
+            status_parts = [f"Current branch: {branch}"]
 
             # Check for uncommitted changes
-            if repo.is_dirty():
+            if modified:
                 status_parts.append("\nModified files:")
-                for item in repo.index.diff(None):
-                    status_parts.append(f"  M {item.a_path}")
+                status_parts.extend(f"  M {path}" for path in modified)
 
             # Check for staged changes
-            staged = repo.index.diff("HEAD")
             if staged:
                 status_parts.append("\nStaged changes:")
-                for item in staged:
-                    status_parts.append(f"  S {item.a_path}")
+                status_parts.extend(f"  S {path}" for path in staged)
 
             # Check for untracked files
-            if repo.untracked_files:
+            if untracked:
                 status_parts.append("\nUntracked files:")
-                for f in repo.untracked_files:
-                    status_parts.append(f"  ? {f}")
+                status_parts.extend(f"  ? {path}" for path in untracked)
 
             if len(status_parts) == 1:
                 status_parts.append("\nWorking tree clean.")
@@ -245,6 +290,41 @@ class GitStatusTool(BaseTool):
             return f"Error getting status: {str(e)}"
 
 
+def _parse_porcelain_status(
+    output: str,
+) -> tuple[str, list[str], list[str], list[str]]:
+    """Split ``git status --porcelain=v2 --branch -z`` output.
+
+    Returns the branch name and the unstaged, staged and untracked paths.
+    """
+    branch = "(unknown)"
+    modified: list[str] = []
+    staged: list[str] = []
+    untracked: list[str] = []
+
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        kind = entry[:1]
+        if kind == "#":
+            if entry.startswith("# branch.head "):
+                branch = entry[len("# branch.head "):]
+        elif kind in ("1", "2", "u"):
+            # Ordinary, renamed/copied and unmerged entries have 8, 9 and 10
+            # space-separated fields before the path
+            fields = entry.split(" ", {"1": 8, "2": 9, "u": 10}[kind])
+            xy, path = fields[1], fields[-1]
+            if kind == "2":
+                next(entries, None)  # Skip the rename's original path
+            if kind == "u" or xy[1] != ".":
+                modified.append(path)
+            if kind != "u" and xy[0] != ".":
+                staged.append(path)
+        elif kind == "?":
+            untracked.append(entry[2:])
+
+    return branch, modified, staged, untracked
+
+
 class GitDeleteBranchInput(BaseModel):
     """Input schema for git branch deletion."""
 
@@ -262,11 +342,11 @@ class GitDeleteBranchTool(BaseTool):
 
     def _run(self, repo_path: str, branch_name: str, force: bool = False) -> str:
         """Delete branch."""
-        if not GIT_AVAILABLE:
+        if not _import_git():
             return "Error: GitPython is not installed."
 
         try:
-            repo = Repo(repo_path)
+            repo = _open_repo(repo_path)
 
             if repo.active_branch.name == branch_name:
                 return f"Error: Cannot delete the currently checked out branch '{branch_name}'"
@@ -283,18 +363,38 @@ class GitDeleteBranchTool(BaseTool):
             return f"Error deleting branch: {str(e)}"
 
 
+# Shared tool instances, built on first use (see FileSystemTool.get_tools)
+_GIT_TOOLS: Optional[tuple[BaseTool, ...]] = None
+
+
 class GitTool:
     """Collection of git tools."""
 
     @staticmethod
     def get_tools() -> list[BaseTool]:
         """Get all git tools."""
-        return [
-            GitInitTool(),
-            GitCommitTool(),
-            GitCreateBranchTool(),
-            GitCheckoutTool(),
-            GitMergeTool(),
-            GitStatusTool(),
-            GitDeleteBranchTool(),
-        ]
+        global _GIT_TOOLS
+        if _GIT_TOOLS is None:
+            _GIT_TOOLS = (
+                GitInitTool(),
+                GitCommitTool(),
+                GitCreateBranchTool(),
+                GitCheckoutTool(),
+                GitMergeTool(),
+                GitStatusTool(),
+                GitDeleteBranchTool(),
+            )
+        return list(_GIT_TOOLS)
+
+    @staticmethod
+    def invalidate(repo_path: Optional[str] = None) -> None:
+        """Drop cached Repo objects, for one repository or all of them."""
+        with _repo_cache_lock:
+            if repo_path is None:
+                repos = list(_repo_cache.values())
+                _repo_cache.clear()
+            else:
+                repo = _repo_cache.pop(_repo_key(repo_path), None)
+                repos = [repo] if repo is not None else []
+        for repo in repos:
+            repo.close()
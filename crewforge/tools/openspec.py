@@ -1,11 +1,39 @@
 """OpenSpec integration tools for spec-driven development."""
 
+import asyncio
+import os
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file in one write and rename it over path.
+
+    Readers never see a half-written document. A symlinked path is followed so
+    the link survives, and an existing file keeps its permission bits.
+    """
+    path = path.resolve()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 class OpenSpecWriterInput(BaseModel):
     """Input schema for OpenSpec writer tool."""
 
@@ -41,12 +69,8 @@ class OpenSpecWriterTool(BaseTool):
     def _run(self, file_type: str, content: str, project_path: str) -> str:
         """Write OpenSpec file to .openspec directory."""
         try:
-            project_dir = Path(project_path)
-            project_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create .openspec directory following OpenSpec convention
-            openspec_dir = project_dir / ".openspec"
-            openspec_dir.mkdir(exist_ok=True)
+            # Files live in the .openspec directory following OpenSpec convention
+            openspec_dir = Path(project_path) / ".openspec"
 
             # Determine filename based on type
             if file_type.lower() == "spec":
@@ -63,8 +87,12 @@ class OpenSpecWriterTool(BaseTool):
                 header = f"# {filename.replace('.md', '')}\n\n"
                 content = header + content
 
-            # Write content
-            file_path.write_text(content, encoding="utf-8")
+            # Write content, creating the directories only if they are missing
+            try:
+                _atomic_write(file_path, content.encode("utf-8"))
+            except FileNotFoundError:
+                openspec_dir.mkdir(parents=True, exist_ok=True)
+                _atomic_write(file_path, content.encode("utf-8"))
 
             return f"Successfully wrote OpenSpec {filename} to {file_path}"
 
@@ -95,10 +123,6 @@ class OpenSpecReaderTool(BaseTool):
         """Read OpenSpec files from .openspec directory."""
         try:
             openspec_dir = Path(project_path) / ".openspec"
-
-            if not openspec_dir.exists():
-                return "No OpenSpec documentation found. The .openspec directory does not exist."
-
             result = []
 
             # Determine which files to read
@@ -109,14 +133,20 @@ class OpenSpecReaderTool(BaseTool):
             else:
                 files_to_read = ["SPEC.md", "PLAN.md"]
 
-            # Read each file
+            # Read each file, opening it directly rather than checking existence first
             for filename in files_to_read:
-                file_path = openspec_dir / filename
-                if file_path.exists():
-                    content = file_path.read_text(encoding="utf-8")
-                    result.append(f"=== {filename} ===\n\n{content}\n")
+                try:
+                    content = (openspec_dir / filename).read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    continue
+                result.append(f"=== {filename} ===\n\n{content}\n")
 
             if not result:
+                if not openspec_dir.is_dir():
+                    return (
+                        "No OpenSpec documentation found. "
+                        "The .openspec directory does not exist."
+                    )
                 return f"No OpenSpec files found in {openspec_dir}"
 
             return "\n".join(result)
@@ -124,6 +154,10 @@ class OpenSpecReaderTool(BaseTool):
         except Exception as e:
             return f"Error reading OpenSpec files: {str(e)}"
 
+    async def _arun(self, project_path: str, file_type: Optional[str] = None) -> str:
+        """Read OpenSpec files in one worker thread."""
+        return await asyncio.to_thread(self._run, project_path, file_type)
+
 
 class OpenSpecUpdateInput(BaseModel):
     """Input schema for OpenSpec update tool."""
@@ -159,39 +193,17 @@ class OpenSpecUpdateTool(BaseTool):
                 return f"Error: {filename} does not exist. Create it first."
 
             # Read current content
-            current_content = file_path.read_text(encoding="utf-8")
+            # Read and splice raw bytes; only the new section needs encoding
+            current_content = file_path.read_bytes()
 
-            # Simple section replacement (look for ## Section)
-            section_header = f"## {section}"
-            if section_header not in current_content:
-                # Add new section at the end
-                updated_content = current_content.rstrip() + f"\n\n{section_header}\n\n{content}\n"
-            else:
-                # Replace existing section
-                # This is a simple implementation - could be made more robust
-                lines = current_content.split('\n')
-                new_lines = []
-                in_section = False
-                section_replaced = False
-
-                for i, line in enumerate(lines):
-                    if line.startswith(f"## {section}"):
-                        in_section = True
-                        new_lines.append(line)
-                        new_lines.append("")
-                        new_lines.append(content)
-                        new_lines.append("")
-                        section_replaced = True
-                    elif in_section and line.startswith("## "):
-                        in_section = False
-                        new_lines.append(line)
-                    elif not in_section:
-                        new_lines.append(line)
-
-                updated_content = '\n'.join(new_lines)
+            updated_content = _replace_section(
+                current_content, f"## {section}".encode("utf-8"), content.encode("utf-8")
+            )
+            if updated_content == current_content:
+                return f"Section '{section}' in {filename} is already up to date"
 
             # Write updated content
-            file_path.write_text(updated_content, encoding="utf-8")
+            _atomic_write(file_path, updated_content)
 
             return f"Successfully updated section '{section}' in {filename}"
 
@@ -199,10 +211,37 @@ class OpenSpecUpdateTool(BaseTool):
             return f"Error updating OpenSpec section: {str(e)}"
 
 
+def _replace_section(text: bytes, header: bytes, content: bytes) -> bytes:
+    """Replace the body of the first section whose header line starts with header.
+
+    The section ends at the next ``## `` header. Missing sections are appended.
+    """
+    if text.startswith(header):
+        start = 0
+    else:
+        start = text.find(b"\n" + header) + 1
+        if not start:
+            return text.rstrip() + b"\n\n" + header + b"\n\n" + content + b"\n"
+
+    header_end = text.find(b"\n", start)
+    if header_end == -1:
+        header_end = len(text)
+    end = text.find(b"\n## ", header_end)
+    rest = text[end:] if end != -1 else b""
+    return text[:header_end] + b"\n\n" + content + b"\n" + rest
+
+
+# Shared tool instances, built on first use (see FileSystemTool.get_tools)
+_OPENSPEC_TOOLS: Optional[tuple[BaseTool, ...]] = None
+
+
 def get_openspec_tools() -> list[BaseTool]:
     """Get all OpenSpec tools."""
-    return [
-        OpenSpecWriterTool(),
-        OpenSpecReaderTool(),
-        OpenSpecUpdateTool(),
-    ]
+    global _OPENSPEC_TOOLS
+    if _OPENSPEC_TOOLS is None:
+        _OPENSPEC_TOOLS = (
+            OpenSpecWriterTool(),
+            OpenSpecReaderTool(),
+            OpenSpecUpdateTool(),
+        )
+    return list(_OPENSPEC_TOOLS)
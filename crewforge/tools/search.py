@@ -1,10 +1,21 @@
 """Web search tool for agents."""
 
-from typing import ClassVar, Optional, Type
+import asyncio
+import atexit
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, ClassVar, Optional, Type
+from urllib.parse import quote_plus
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ._cache import TTLCache, cached
+
 try:
     import httpx
 
@@ -12,6 +23,95 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:  # Optional: responses are parsed with the stdlib json module
+    orjson = None
+
+# HTTP/2 lets concurrent searches share one connection; it needs the optional
+# h2 package (the "http2" extra), otherwise clients stay on HTTP/1.1.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+# One pooled client for all search calls, so repeat requests to the same API
+# reuse a kept-alive connection instead of a new TCP and TLS handshake each time.
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+# Async clients hold connections bound to the event loop that opened them, so
+# instead of living for the process they are scoped to a batch of calls (or a
+# single call) and closed when it ends. Calls inside the batch find it here.
+_batch_async_client: ContextVar[Optional["httpx.AsyncClient"]] = ContextVar(
+    "crewforge_search_async_client", default=None
+)
+
+
+def _client_options() -> dict[str, Any]:
+    return {
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        "timeout": 30.0,
+        "http2": HTTP2_AVAILABLE,
+    }
+
+
+def _parse_json(response: "httpx.Response") -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    return orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+
+
+def _get_client() -> "httpx.Client":
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**_client_options())
+                atexit.register(close_http_client)
+    return _client
+
+
+@asynccontextmanager
+async def _async_client() -> AsyncIterator[Optional["httpx.AsyncClient"]]:
+    """Yield the enclosing batch's async HTTP client, or open one for this block.
+
+    A client opened here is shared by calls nested in the block and closed on exit.
+    Yields None when httpx is not installed.
+    """
+    client = _batch_async_client.get()
+    if client is not None or not HTTPX_AVAILABLE:
+        yield client
+        return
+    async with httpx.AsyncClient(**_client_options()) as client:
+        token = _batch_async_client.set(client)
+        try:
+            yield client
+        finally:
+            _batch_async_client.reset(token)
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+# Agents repeat the same lookups within a run; successful results are reused for
+# a while (code search longer, as indexed code changes slowly) so repeats skip
+# the round trip and the API quota.
+_WEB_SEARCH_CACHE = TTLCache(ttl=600)
+_CODE_SEARCH_CACHE = TTLCache(ttl=1800)
+
+
+def _is_web_result(result: str) -> bool:
+    return not result.startswith(("Error:", "Search error:"))
+
+
+def _is_code_result(result: str) -> bool:
+    return not result.startswith(("Error:", "Code search error:", "GitHub API rate limit"))
+
 
 class WebSearchInput(BaseModel):
     """Input schema for web search."""
@@ -35,6 +135,7 @@ class WebSearchTool(BaseTool):
     search_api_url: str = "https://api.search.brave.com/res/v1/web/search"
     api_key: Optional[str] = None
 
+    @cached(_WEB_SEARCH_CACHE, fields=("search_api_url", "api_key"), cache_if=_is_web_result)
     def _run(self, query: str, num_results: int = 5) -> str:
         """Search the web."""
         if not HTTPX_AVAILABLE:
@@ -45,44 +146,64 @@ class WebSearchTool(BaseTool):
             return self._fallback_search(query)
 
         try:
-            headers = {
+            response = _get_client().get(**self._request(query, num_results))
+            response.raise_for_status()
+            return self._format_results(_parse_json(response), query, num_results)
+        except Exception as e:
+            return f"Search error: {str(e)}\n\nTrying fallback search..."
+
+    @cached(_WEB_SEARCH_CACHE, fields=("search_api_url", "api_key"), cache_if=_is_web_result)
+    async def _arun(self, query: str, num_results: int = 5) -> str:
+        """Search the web without blocking the event loop."""
+        if not HTTPX_AVAILABLE:
+            return "Error: httpx is not installed."
+
+        if not self.api_key:
+            return self._fallback_search(query)
+
+        try:
+            async with _async_client() as client:
+                response = await client.get(**self._request(query, num_results))
+            response.raise_for_status()
+            return self._format_results(_parse_json(response), query, num_results)
+        except Exception as e:
+            return f"Search error: {str(e)}\n\nTrying fallback search..."
+
+    def _request(self, query: str, num_results: int) -> dict[str, Any]:
+        """Build the search API request arguments."""
+        return {
+            "url": self.search_api_url,
+            "headers": {
                 "Accept": "application/json",
                 "X-Subscription-Token": self.api_key,
-            }
-            params = {
+            },
+            "params": {
                 "q": query,
                 "count": num_results,
-            }
-
-            with httpx.Client() as client:
-                response = client.get(
-                    self.search_api_url,
-                    headers=headers,
-                    params=params,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            },
+            "timeout": 30.0,
+        }
 
-            results = []
-            web_results = data.get("web", {}).get("results", [])
+    @staticmethod
+    def _format_results(data: dict, query: str, num_results: int) -> str:
+        """Format search API results for the agent."""
+        results = []
+        web_results = data.get("web", {}).get("results", [])
 
-            for i, result in enumerate(web_results[:num_results], 1):
-                title = result.get("title", "No title")
-                url = result.get("url", "")
-                description = result.get("description", "No description")
-                results.append(f"{i}. {title}\n   URL: {url}\n   {description}\n")
+        for i, result in enumerate(web_results[:num_results], 1):
+            title = result.get("title", "No title")
+            url = result.get("url", "")
+            description = result.get("description", "No description")
+            results.append(f"{i}. {title}\n   URL: {url}\n   {description}\n")
 
-            if not results:
-                return f"No results found for: {query}"
+        if not results:
+            return f"No results found for: {query}"
 
-            return "\n".join(results)
-
-        except Exception as e:
-            return f"Search error: {str(e)}\n\nTrying fallback search..."
+        return "\n".join(results)
 
     def _fallback_search(self, query: str) -> str:
         """Fallback when no API key is configured."""
+        q = quote_plus(query)
         return f"""Web search requires API configuration.
 
 To enable web search:
@@ -90,11 +211,11 @@ To enable web search:
 2. Set CREWFORGE_SEARCH_API_KEY environment variable
 
 For now, here are some suggested resources for "{query}":
-- Stack Overflow: https://stackoverflow.com/search?q={query.replace(' ', '+')}
-- GitHub: https://github.com/search?q={query.replace(' ', '+')}
-- MDN (for web): https://developer.mozilla.org/en-US/search?q={query.replace(' ', '+')}
-- Docs.rs (for Rust): https://docs.rs/releases/search?query={query.replace(' ', '+')}
-- PyPI (for Python): https://pypi.org/search/?q={query.replace(' ', '+')}
+- Stack Overflow: https://stackoverflow.com/search?q={q}
+- GitHub: https://github.com/search?q={q}
+- MDN (for web): https://developer.mozilla.org/en-US/search?q={q}
+- Docs.rs (for Rust): https://docs.rs/releases/search?query={q}
+- PyPI (for Python): https://pypi.org/search/?q={q}
 """
 
 
@@ -118,6 +239,7 @@ class CodeSearchTool(BaseTool):
 
     github_token: Optional[str] = None
 
+    @cached(_CODE_SEARCH_CACHE, fields=("github_token",), cache_if=_is_code_result)
     def _run(
         self, query: str, language: Optional[str] = None, num_results: int = 5
     ) -> str:
@@ -126,49 +248,127 @@ class CodeSearchTool(BaseTool):
             return "Error: httpx is not installed."
 
         try:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-            }
-            if self.github_token:
-                headers["Authorization"] = f"token {self.github_token}"
+            response = _get_client().get(**self._request(query, language, num_results))
+            return self._format_response(response, query, num_results)
+        except Exception as e:
+            return f"Code search error: {str(e)}"
+
+    @cached(_CODE_SEARCH_CACHE, fields=("github_token",), cache_if=_is_code_result)
+    async def _arun(
+        self, query: str, language: Optional[str] = None, num_results: int = 5
+    ) -> str:
+        """Search for code on GitHub without blocking the event loop."""
+        if not HTTPX_AVAILABLE:
+            return "Error: httpx is not installed."
 
-            search_query = query
-            if language:
-                search_query += f" language:{language}"
+        try:
+            async with _async_client() as client:
+                response = await client.get(**self._request(query, language, num_results))
+            return self._format_response(response, query, num_results)
+        except Exception as e:
+            return f"Code search error: {str(e)}"
 
-            params = {
+    def _request(
+        self, query: str, language: Optional[str], num_results: int
+    ) -> dict[str, Any]:
+        """Build the GitHub code search request arguments."""
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+        }
+        if self.github_token:
+            headers["Authorization"] = f"token {self.github_token}"
+
+        search_query = query
+        if language:
+            search_query += f" language:{language}"
+
+        return {
+            "url": "https://api.github.com/search/code",
+            "headers": headers,
+            "params": {
                 "q": search_query,
                 "per_page": num_results,
-            }
+            },
+            "timeout": 30.0,
+        }
 
-            with httpx.Client() as client:
-                response = client.get(
-                    "https://api.github.com/search/code",
-                    headers=headers,
-                    params=params,
-                    timeout=30.0,
-                )
+    @staticmethod
+    def _format_response(response: "httpx.Response", query: str, num_results: int) -> str:
+        """Format a GitHub code search response for the agent."""
+        if response.status_code == 403:
+            return "GitHub API rate limit exceeded. Set GITHUB_TOKEN for higher limits."
 
-                if response.status_code == 403:
-                    return "GitHub API rate limit exceeded. Set GITHUB_TOKEN for higher limits."
+        response.raise_for_status()
+        data = _parse_json(response)
 
-                response.raise_for_status()
-                data = response.json()
+        results = []
+        for item in data.get("items", [])[:num_results]:
+            repo = item.get("repository", {}).get("full_name", "unknown")
+            path = item.get("path", "")
+            url = item.get("html_url", "")
+            results.append(f"- {repo}/{path}\n  {url}\n")
 
-            results = []
-            for item in data.get("items", [])[:num_results]:
-                repo = item.get("repository", {}).get("full_name", "unknown")
-                path = item.get("path", "")
-                url = item.get("html_url", "")
-                results.append(f"- {repo}/{path}\n  {url}\n")
+        if not results:
+            return f"No code found for: {query}"
 
-            if not results:
-                return f"No code found for: {query}"
+        return "Found code examples:\n\n" + "\n".join(results)
 
-            return "Found code examples:\n\n" + "\n".join(results)
 
-        except Exception as e:
-            return f"Code search error: {str(e)}"
+class MultiCodeSearchInput(BaseModel):
+    """Input schema for running several code searches at once."""
+
+    queries: list[CodeSearchInput] = Field(..., description="Code searches to run together")
+
+
+class MultiCodeSearchTool(BaseTool):
+    """Tool to run several GitHub code searches in parallel."""
+
+    name: str = "multi_code_search"
+    description: str = """Search GitHub for several code examples at once.
+    Use this instead of repeated code_search calls when looking for related snippets;
+    the searches run in parallel and results are grouped by query."""
+    args_schema: Type[BaseModel] = MultiCodeSearchInput
+
+    github_token: Optional[str] = None
+
+    # Upper bound on concurrent GitHub requests from one call
+    max_workers: ClassVar[int] = 8
+
+    def _run(self, queries: list) -> str:
+        """Run the searches on a small thread pool."""
+        queries = self._normalize(queries)
+        if not queries:
+            return "No code search queries given."
+
+        tool = CodeSearchTool(github_token=self.github_token)
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.max_workers)) as pool:
+            results = list(pool.map(lambda q: tool._run(**q), queries))
+        return self._format(queries, results)
+
+    async def _arun(self, queries: list) -> str:
+        """Run the searches concurrently on the event loop."""
+        queries = self._normalize(queries)
+        if not queries:
+            return "No code search queries given."
+
+        tool = CodeSearchTool(github_token=self.github_token)
+        async with _async_client():
+            results = await asyncio.gather(*(tool._arun(**q) for q in queries))
+        return self._format(queries, results)
+
+    @staticmethod
+    def _normalize(queries: list) -> list[dict[str, Any]]:
+        """Accept validated dicts (from BaseTool.run) or CodeSearchInput objects."""
+        return [q.model_dump() if isinstance(q, BaseModel) else dict(q) for q in queries]
+
+    @staticmethod
+    def _format(queries: list[dict[str, Any]], results: list[str]) -> str:
+        """Group each query's results under a header."""
+        sections = []
+        for q, result in zip(queries, results):
+            label = q["query"] + (f" ({q['language']})" if q.get("language") else "")
+            sections.append(f"=== {label} ===\n{result}")
+        return "\n".join(sections)
 
 
 class DocumentationSearchInput(BaseModel):
@@ -193,6 +393,10 @@ class DocumentationSearchTool(BaseTool):
         "rust": "https://docs.rs/{package}/latest/{package}/",
         "go": "https://pkg.go.dev/{package}",
     }
+    # Templates split around {package}, so building a URL is a join, not a format parse
+    _URL_PARTS: ClassVar[dict[str, list[str]]] = {
+        language: template.split("{package}") for language, template in DOC_URLS.items()
+    }
 
     def _run(
         self, package: str, language: str, topic: Optional[str] = None
@@ -203,13 +407,13 @@ class DocumentationSearchTool(BaseTool):
         if language not in self.DOC_URLS:
             return f"Unsupported language: {language}. Supported: python, javascript, rust, go"
 
-        base_url = self.DOC_URLS[language].format(package=package)
+        base_url = package.join(self._URL_PARTS[language])
 
         result = f"Documentation for {package} ({language}):\n"
         result += f"URL: {base_url}\n\n"
 
         if topic:
-            result += f"Suggested search: {base_url}?q={topic.replace(' ', '+')}\n"
+            result += f"Suggested search: {base_url}?q={quote_plus(topic)}\n"
 
         # Add common doc patterns
         if language == "python":
@@ -220,3 +424,20 @@ class DocumentationSearchTool(BaseTool):
             result += f"Examples: https://docs.rs/{package}/latest/{package}/#examples\n"
 
         return result
+
+    async def _arun(
+        self, package: str, language: str, topic: Optional[str] = None
+    ) -> str:
+        """Search documentation; no I/O is involved, so this runs inline."""
+        return self._run(package, language, topic)
+
+
+async def batch_search(calls: list[tuple[BaseTool, dict[str, Any]]]) -> list[str]:
+    """Run several search tool calls concurrently.
+
+    Takes (tool, arguments) pairs and returns the results in the same order, so
+    total latency is that of the slowest request rather than the sum of all.
+    The calls share one async HTTP client, closed once they have all finished.
+    """
+    async with _async_client():
+        return list(await asyncio.gather(*(tool.arun(**kwargs) for tool, kwargs in calls)))
@@ -1,12 +1,18 @@
 """Shell execution tool for agents."""
 
+import os
+import re
+import signal
 import subprocess
 import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar, Optional, Type
 
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ShellCommandInput(BaseModel):
@@ -21,6 +27,39 @@ class ShellCommandInput(BaseModel):
     )
 
 
+_READ_CHUNK = 64 * 1024
+
+
+def _drain(stream, limit: int, sink: list[str]) -> None:
+    """Read a pipe to EOF, keeping at most limit characters in sink.
+
+    Reading continues past the limit so the child never blocks on a full pipe;
+    the excess is only counted and reported.
+    """
+    kept = total = 0
+    while chunk := stream.read(_READ_CHUNK):
+        total += len(chunk)
+        if kept < limit:
+            piece = chunk[: limit - kept]
+            sink.append(piece)
+            kept += len(piece)
+    stream.close()
+    if total > kept:
+        sink.append(f"\n... [output truncated, {total - kept} more characters]")
+
+
+def _kill_tree(process: subprocess.Popen) -> None:
+    """Kill a command and, on POSIX, anything it started in the background."""
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        process.kill()
+    process.wait()
+
+
 class ShellExecutorTool(BaseTool):
     """Tool to execute shell commands."""
 
@@ -39,6 +78,12 @@ class ShellExecutorTool(BaseTool):
         "dd if=/dev/zero",
         "chmod -R 777 /",
     ]
+    # All blocked patterns as one alternation, so a command is scanned once
+    _BLOCKED_RE: ClassVar[re.Pattern] = re.compile("|".join(map(re.escape, BLOCKED_COMMANDS)))
+
+    # Output kept per stream; builds and installs can print far more than an
+    # agent can use, and it would otherwise all be held in memory
+    max_output_chars: int = 1_000_000
 
     def _run(
         self,
@@ -47,43 +92,82 @@ class ShellExecutorTool(BaseTool):
         timeout: int = 300,
     ) -> str:
         """Execute shell command."""
+        return self._execute(command, working_dir, timeout)[0]
+
+    def _execute(
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        timeout: int = 300,
+    ) -> tuple[str, Optional[int]]:
+        """Execute shell command, returning the output and the exit code.
+
+        The exit code is None when the command was not run to completion
+        (blocked, bad working directory, timeout or launch failure).
+        """
         # Safety check
-        for blocked in self.BLOCKED_COMMANDS:
-            if blocked in command:
-                return f"Error: Command contains blocked pattern '{blocked}'"
+        blocked = self._BLOCKED_RE.search(command)
+        if blocked:
+            return f"Error: Command contains blocked pattern '{blocked.group()}'", None
 
         try:
             # Determine working directory
             cwd = Path(working_dir) if working_dir else Path.cwd()
             if not cwd.exists():
-                return f"Error: Working directory '{cwd}' does not exist."
+                return f"Error: Working directory '{cwd}' does not exist.", None
 
-            # Execute command
-            result = subprocess.run(
+            # Execute command, reading both pipes as output arrives. The command
+            # gets its own process group so background children can be killed too
+            deadline = time.monotonic() + timeout
+            process = subprocess.Popen(
                 command,
                 shell=True,
                 cwd=cwd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=timeout,
+                start_new_session=os.name == "posix",
             )
+            stdout: list[str] = []
+            stderr: list[str] = []
+            readers = [
+                threading.Thread(
+                    target=_drain, args=(pipe, self.max_output_chars, sink), daemon=True
+                )
+                for pipe, sink in ((process.stdout, stdout), (process.stderr, stderr))
+            ]
+            for reader in readers:
+                reader.start()
+
+            try:
+                returncode = process.wait(timeout=timeout)
+                # A backgrounded child can keep the pipes open after the shell exits
+                for reader in readers:
+                    reader.join(max(deadline - time.monotonic(), 0))
+                if any(reader.is_alive() for reader in readers):
+                    raise subprocess.TimeoutExpired(command, timeout)
+            except BaseException:
+                # In its own session the command never sees a terminal Ctrl-C, so
+                # timeouts and interrupts alike must take the whole group down here
+                _kill_tree(process)
+                raise
 
             output_parts = []
 
-            if result.stdout:
-                output_parts.append(f"STDOUT:\n{result.stdout}")
+            if stdout:
+                output_parts.append(f"STDOUT:\n{''.join(stdout)}")
 
-            if result.stderr:
-                output_parts.append(f"STDERR:\n{result.stderr}")
+            if stderr:
+                output_parts.append(f"STDERR:\n{''.join(stderr)}")
 
-            output_parts.append(f"EXIT CODE: {result.returncode}")
+            output_parts.append(f"EXIT CODE: {returncode}")
 
-            return "\n\n".join(output_parts)
+            return "\n\n".join(output_parts), returncode
 
         except subprocess.TimeoutExpired:
-            return f"Error: Command timed out after {timeout} seconds"
+            return f"Error: Command timed out after {timeout} seconds", None
         except Exception as e:
-            return f"Error executing command: {str(e)}"
+            return f"Error executing command: {str(e)}", None
 
 
 class MultiCommandInput(BaseModel):
@@ -96,6 +180,13 @@ class MultiCommandInput(BaseModel):
     stop_on_error: bool = Field(
         default=True, description="Stop execution if a command fails"
     )
+    parallel: bool = Field(
+        default=False,
+        description=(
+            "Run all commands at the same time. Only for commands that do not depend "
+            "on each other; stop_on_error does not apply."
+        ),
+    )
 
 
 class MultiShellExecutorTool(BaseTool):
@@ -103,25 +194,43 @@ class MultiShellExecutorTool(BaseTool):
 
     name: str = "execute_shell_multi"
     description: str = """Execute multiple shell commands sequentially.
-    Optionally stop on first error."""
+    Optionally stop on first error, or run independent commands in parallel."""
     args_schema: Type[BaseModel] = MultiCommandInput
 
+    # Built once with this tool rather than on every batch
+    _shell_tool: ShellExecutorTool = PrivateAttr(default_factory=ShellExecutorTool)
+
     def _run(
         self,
         commands: list[str],
         working_dir: Optional[str] = None,
         stop_on_error: bool = True,
+        parallel: bool = False,
     ) -> str:
         """Execute multiple shell commands."""
-        shell_tool = ShellExecutorTool()
+        shell_tool = self._shell_tool
+
+        if parallel and len(commands) > 1:
+            # Wall time becomes that of the slowest command; results keep input order
+            workers = min(len(commands), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outputs = pool.map(
+                    lambda command: shell_tool._run(command=command, working_dir=working_dir),
+                    commands,
+                )
+                return "\n\n".join(
+                    f"=== Command {i}: {command} ===\n{result}"
+                    for i, (command, result) in enumerate(zip(commands, outputs), 1)
+                )
+
         results = []
 
         for i, command in enumerate(commands, 1):
-            result = shell_tool._run(command=command, working_dir=working_dir)
+            result, exit_code = shell_tool._execute(command, working_dir)
             results.append(f"=== Command {i}: {command} ===\n{result}")
 
             # Check for error
-            if stop_on_error and "EXIT CODE: 0" not in result:
+            if stop_on_error and exit_code != 0:
                 results.append(f"\nStopped at command {i} due to error.")
                 break
 
@@ -28,6 +28,17 @@ class TestFileSystemTools:
             result = read_tool._run(str(file_path))
             assert result == content
 
+    def test_async_write_and_read_file(self):
+        """Test the async entry points of the file tools."""
+        import asyncio
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = str(Path(tmpdir) / "sub" / "test.txt")
+
+            result = asyncio.run(WriteFileTool().arun(file_path=file_path, content="async"))
+            assert "Successfully wrote" in result
+            assert asyncio.run(ReadFileTool().arun(file_path=file_path)) == "async"
+
     def test_read_nonexistent_file(self):
         """Test reading a file that doesn't exist."""
         read_tool = ReadFileTool()
@@ -50,6 +61,22 @@ class TestFileSystemTools:
             assert "subdir" in result
 
 
+    def test_list_directory_recursive_pattern(self):
+        """Test recursive listing filtered by a name pattern."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "pkg" / "sub").mkdir(parents=True)
+            (Path(tmpdir) / "pkg" / "a.py").touch()
+            (Path(tmpdir) / "pkg" / "sub" / "b.py").touch()
+            (Path(tmpdir) / "notes.txt").touch()
+
+            result = ListDirectoryTool()._run(tmpdir, recursive=True, pattern="*.py")
+
+            assert result.splitlines() == [
+                f"[FILE] {Path('pkg', 'a.py')}",
+                f"[FILE] {Path('pkg', 'sub', 'b.py')}",
+            ]
+
+
 class TestShellTool:
     """Tests for shell executor tool."""
 
@@ -77,6 +104,25 @@ class TestShellTool:
 
         assert "blocked" in result.lower()
 
+    def test_multi_command_stops_on_exit_code(self):
+        """Test that stop_on_error uses the exit code, not the printed output."""
+        from crewforge.tools.shell import MultiShellExecutorTool
+
+        result = MultiShellExecutorTool()._run(["echo 'EXIT CODE: 0'; exit 2", "echo never"])
+
+        assert "Stopped at command 1" in result
+        assert "never" not in result
+
+    def test_timeout_with_background_child(self):
+        """Test that a backgrounded child holding the pipes can't outlast the timeout."""
+        import time
+
+        start = time.monotonic()
+        result = ShellExecutorTool()._run("sleep 6 & echo hi", timeout=1)
+
+        assert "timed out" in result
+        assert time.monotonic() - start < 4
+
 
 class TestGitTools:
     """Tests for git tools."""
@@ -91,6 +137,249 @@ class TestGitTools:
 
             assert "Initialized" in result or "Error" in result  # May fail if git not installed
 
+    def test_repo_is_cached_between_calls(self):
+        """Test that git tools reuse one Repo per repository path."""
+        from crewforge.tools.git import GitCommitTool, GitInitTool, GitTool, _open_repo
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            GitInitTool()._run(tmpdir, "main")
+            repo = _open_repo(tmpdir)
+            assert _open_repo(str(Path(tmpdir) / ".")) is repo
+
+            with repo.config_writer() as config:
+                config.set_value("user", "name", "Test")
+                config.set_value("user", "email", "test@example.com")
+            (Path(tmpdir) / "a.txt").write_text("a")
+            assert "Committed" in GitCommitTool()._run(tmpdir, "first")
+
+            GitTool.invalidate(tmpdir)
+            assert _open_repo(tmpdir) is not repo
+            GitTool.invalidate()
+
+    def test_parse_porcelain_status(self):
+        """Test splitting porcelain v2 status output into sections."""
+        from crewforge.tools.git import _parse_porcelain_status
+
+        output = "\0".join([
+            "# branch.oid 1234",
+            "# branch.head feature",
+            "1 .M N... 100644 100644 100644 aaa aaa a.txt",
+            "1 MM N... 100644 100644 100644 aaa bbb b c.txt",
+            "2 R. N... 100644 100644 100644 aaa aaa R100 new.txt",
+            "old.txt",
+            "? untracked.txt",
+            "",
+        ])
+
+        branch, modified, staged, untracked = _parse_porcelain_status(output)
+
+        assert branch == "feature"
+        assert modified == ["a.txt", "b c.txt"]
+        assert staged == ["b c.txt", "new.txt"]
+        assert untracked == ["untracked.txt"]
+
+
+class TestSearchTools:
+    """Tests for search tools."""
+
+    def test_batch_search(self, monkeypatch):
+        """Test running several search tools concurrently, results in call order."""
+        import asyncio
+
+        import httpx
+
+        from crewforge.tools import search
+
+        def handler(request):
+            return httpx.Response(200, json={"web": {"results": [
+                {"title": request.url.params["q"], "url": "u", "description": "d"},
+            ]}})
+
+        clients = []
+
+        class RecordingClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(transport=httpx.MockTransport(handler))
+                clients.append(self)
+
+        monkeypatch.setattr(search.httpx, "AsyncClient", RecordingClient)
+        search._WEB_SEARCH_CACHE.clear()
+
+        results = asyncio.run(search.batch_search([
+            (search.WebSearchTool(api_key="key"), {"query": "first"}),
+            (search.DocumentationSearchTool(), {"package": "rich", "language": "python"}),
+            (search.WebSearchTool(api_key="key"), {"query": "second"}),
+        ]))
+
+        assert results[0].startswith("1. first")
+        assert "https://pypi.org/project/rich/" in results[1]
+        assert results[2].startswith("1. second")
+        # One client for the whole batch, closed when it finished
+        assert len(clients) == 1 and clients[0].is_closed
+        search._WEB_SEARCH_CACHE.clear()
+
+
+    def test_search_results_are_cached(self, monkeypatch):
+        """Test that repeat searches reuse results and errors are not cached."""
+        import httpx
+
+        from crewforge.tools import search
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(500)
+            return httpx.Response(200, json={"items": [
+                {"repository": {"full_name": "a/b"}, "path": "x.py", "html_url": "h"},
+            ]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(search, "_get_client", lambda: client)
+        search._CODE_SEARCH_CACHE.clear()
+        tool = search.CodeSearchTool()
+
+        assert "Code search error" in tool._run("cache me")
+        first = tool._run("cache me")
+        assert tool._run(query="cache me", language=None) == first
+        assert len(requests) == 2
+        search._CODE_SEARCH_CACHE.clear()
+
+
+    def test_multi_code_search(self, monkeypatch):
+        """Test that multi-query code search groups results per query."""
+        import httpx
+
+        from crewforge.tools import search
+
+        def handler(request):
+            name = request.url.params["q"].split()[0]
+            return httpx.Response(200, json={"items": [
+                {"repository": {"full_name": "o/r"}, "path": f"{name}.py", "html_url": "h"},
+            ]})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(search, "_get_client", lambda: client)
+        search._CODE_SEARCH_CACHE.clear()
+
+        result = search.MultiCodeSearchTool().run(
+            queries=[{"query": "alpha"}, {"query": "beta", "language": "go"}]
+        )
+
+        assert result.index("=== alpha ===") < result.index("o/r/alpha.py")
+        assert result.index("=== beta (go) ===") < result.index("o/r/beta.py")
+        search._CODE_SEARCH_CACHE.clear()
+
+    def test_developer_agent_has_code_search_tools(self):
+        """Test that the developer agent gets single and multi-query code search."""
+        from crewforge.core.agents import DeveloperAgent
+
+        names = {tool.name for tool in DeveloperAgent._build_tools()}
+
+        assert {"code_search", "multi_code_search"} <= names
+
+    def test_concurrent_identical_searches_share_one_call(self):
+        """Test that concurrent calls with the same arguments run once."""
+        import asyncio
+
+        from crewforge.tools._cache import TTLCache, cached
+
+        calls = []
+
+        class Tool:
+            @cached(TTLCache(ttl=60))
+            async def _arun(self, query: str) -> str:
+                calls.append(query)
+                await asyncio.sleep(0.01)
+                return query.upper()
+
+        async def run():
+            return await asyncio.gather(*(Tool()._arun("same") for _ in range(3)))
+
+        assert asyncio.run(run()) == ["SAME"] * 3
+        assert calls == ["same"]
+
+
+class TestBrowserTools:
+    """Tests for browser tools."""
+
+    def test_browser_is_reused_per_thread_and_stopped_with_it(self, monkeypatch):
+        """Test that a thread reuses its browser and stops Playwright when it exits."""
+        import threading
+        from types import SimpleNamespace
+
+        from crewforge.tools import browser
+
+        launched, stopped = [], []
+
+        def launch(headless):
+            launched.append(SimpleNamespace(is_connected=lambda: True))
+            return launched[-1]
+
+        def start():
+            driver = SimpleNamespace(chromium=SimpleNamespace(launch=launch))
+            driver.stop = lambda: stopped.append(driver)
+            return driver
+
+        monkeypatch.setattr(
+            browser, "sync_playwright", lambda: SimpleNamespace(start=start), raising=False
+        )
+
+        results = []
+
+        def worker():
+            results.extend([browser._get_browser(), browser._get_browser()])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert results[0] is results[1]
+        assert len(launched) == 1
+        assert len(stopped) == 1
+
+
+class TestOpenSpecTools:
+    """Tests for OpenSpec tools."""
+
+    def test_update_section(self):
+        """Test replacing an existing section and appending a new one."""
+        from crewforge.tools.openspec import OpenSpecUpdateTool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spec_dir = Path(tmpdir) / ".openspec"
+            spec_dir.mkdir()
+            spec = spec_dir / "SPEC.md"
+            spec.write_text("# Spec\n\n## Scope\n\nold\n### Detail\nx\n\n## Notes\n\nkeep\n")
+
+            tool = OpenSpecUpdateTool()
+            assert "Successfully" in tool._run(tmpdir, "spec", "Scope", "new")
+            tool._run(tmpdir, "spec", "Risks", "none")
+
+            assert spec.read_text() == (
+                "# Spec\n\n## Scope\n\nnew\n\n## Notes\n\nkeep\n\n## Risks\n\nnone\n"
+            )
+            assert "already up to date" in tool._run(tmpdir, "spec", "Scope", "new")
+
+    def test_update_keeps_symlink_and_mode(self):
+        """Test that rewriting a symlinked document keeps the link and its mode."""
+        from crewforge.tools.openspec import OpenSpecUpdateTool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spec_dir = Path(tmpdir) / ".openspec"
+            spec_dir.mkdir()
+            target = Path(tmpdir) / "shared-spec.md"
+            target.write_text("# Spec\n\n## Scope\n\nold\n")
+            target.chmod(0o640)
+            (spec_dir / "SPEC.md").symlink_to(target)
+
+            OpenSpecUpdateTool()._run(tmpdir, "spec", "Scope", "new")
+
+            assert (spec_dir / "SPEC.md").is_symlink()
+            assert "new" in target.read_text()
+            assert target.stat().st_mode & 0o777 == 0o640
+
 
 class TestDatabaseOperations:
     """Tests for database operations."""
@@ -135,6 +424,302 @@ class TestDatabaseOperations:
 
             assert updated_task.status == TaskStatus.IN_PROGRESS
 
+            assert db.increment_task_retry(task.id) == 1
+            assert db.increment_task_retry(task.id) == 2
+            assert db.get_task(task.id).status == TaskStatus.RETRYING
+
+    def test_bulk_create_tasks(self):
+        """Test creating several tasks in one transaction."""
+        from crewforge.storage import Database, TaskStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            tasks = db.bulk_create_tasks(
+                project.id,
+                [{"title": "A", "description": "first"}, {"title": "B"}],
+            )
+
+            assert [t.title for t in tasks] == ["A", "B"]
+            assert all(t.id is not None for t in tasks)
+            assert tasks[0].status == TaskStatus.PENDING
+            assert [t.title for t in db.get_project_tasks(project.id)] == ["A", "B"]
+
+    def test_bulk_create_tasks_without_returning(self):
+        """Test the add_all fallback for dialects without INSERT ... RETURNING."""
+        from crewforge.storage import Database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+            project = db.create_project(name="test-project")
+
+            dialect = db.engine.dialect
+            dialect.insert_returning = dialect.insert_executemany_returning = False
+            dialect.use_insertmanyvalues = False
+            tasks = db.bulk_create_tasks(project.id, [{"title": "C"}, {"title": "D"}])
+
+            assert [t.title for t in tasks] == ["C", "D"]
+            assert all(t.id is not None for t in tasks)
+            assert [t.title for t in db.get_project_tasks(project.id)] == ["C", "D"]
+
+    def test_bulk_add_agent_logs(self):
+        """Test adding several log entries in one statement."""
+        from crewforge.storage import Database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            task = db.create_task(project_id=project.id, title="A")
+            logs = db.bulk_add_agent_logs([
+                {"task_id": task.id, "agent_role": "developer", "action": "start"},
+                {
+                    "task_id": task.id,
+                    "agent_role": "reviewer",
+                    "action": "review",
+                    "level": "ERROR",
+                },
+            ])
+
+            assert [log.level for log in logs] == ["INFO", "ERROR"]
+            assert all(log.id is not None and log.created_at for log in logs)
+            assert [log.action for log in db.get_task_logs(task.id)] == ["start", "review"]
+
+    def test_update_requirements_with_status(self):
+        """Test updating requirements and status in a single call."""
+        from crewforge.storage import Database, ProjectStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            db.update_project_requirements(
+                project.id, "reqs", approved=True, status=ProjectStatus.REQUIREMENTS_APPROVED
+            )
+
+            updated = db.get_project(project.id)
+            assert updated.requirements == "reqs"
+            assert updated.requirements_approved
+            assert updated.status == ProjectStatus.REQUIREMENTS_APPROVED
+
+    def test_nested_operations_share_one_transaction(self):
+        """Test that calls inside get_session() commit or roll back together."""
+        from crewforge.storage import Database, ProjectStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+            project = db.create_project(name="test-project")
+
+            with pytest.raises(RuntimeError):
+                with db.get_session():
+                    db.create_task(project_id=project.id, title="A")
+                    db.update_project_status(project.id, ProjectStatus.DEVELOPING)
+                    raise RuntimeError("abort")
+
+            assert db.get_project_tasks(project.id) == []
+            assert db.get_project(project.id).status == ProjectStatus.INITIALIZING
+
+            with db.get_session():
+                db.create_task(project_id=project.id, title="A")
+                db.update_project_status(project.id, ProjectStatus.DEVELOPING)
+
+            assert [t.title for t in db.get_project_tasks(project.id)] == ["A"]
+            assert db.get_project(project.id).status == ProjectStatus.DEVELOPING
+
+            # Nested reads return the caller's instance instead of expunging it
+            with db.get_session() as session:
+                session.get(type(project), project.id).description = "changed"
+                db.get_project(project.id)
+            assert db.get_project(project.id).description == "changed"
+
+            # The project cache never holds rows from a rolled-back transaction
+            with pytest.raises(RuntimeError):
+                with db.get_session():
+                    db.create_project(name="ghost")
+                    assert db.get_project_by_name("ghost") is not None
+                    raise RuntimeError("abort")
+
+            assert db.get_project_by_name("ghost") is None
+            assert [p.name for p in db.list_projects()] == ["test-project"]
+
+    def test_get_project_logs(self):
+        """Test fetching all logs for a project in one query."""
+        from crewforge.storage import Database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            other = db.create_project(name="other-project")
+            task_a = db.create_task(project_id=project.id, title="A")
+            task_b = db.create_task(project_id=project.id, title="B")
+            task_c = db.create_task(project_id=other.id, title="C")
+
+            db.add_agent_log(task_a.id, "developer", "start")
+            db.add_agent_log(task_b.id, "reviewer", "review", level="ERROR")
+            db.add_agent_log(task_c.id, "tester", "test")
+
+            logs = db.get_project_logs(project.id)
+            assert [log.action for log in logs] == ["start", "review"]
+
+            errors = db.get_project_logs(project.id, level="ERROR")
+            assert [log.action for log in errors] == ["review"]
+
+    def test_get_task_status_counts(self):
+        """Test grouped task status counts across projects."""
+        from crewforge.storage import Database, TaskStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            empty = db.create_project(name="empty-project")
+            done = db.create_task(project_id=project.id, title="Done")
+            db.create_task(project_id=project.id, title="Todo 1")
+            db.create_task(project_id=project.id, title="Todo 2")
+            db.update_task_status(done.id, TaskStatus.COMPLETED)
+
+            counts = db.get_task_status_counts([project.id, empty.id])
+
+            assert counts[project.id] == {TaskStatus.COMPLETED: 1, TaskStatus.PENDING: 2}
+            assert counts[empty.id] == {}
+
+    def test_project_lookup_cache_invalidated_on_write(self):
+        """Test that cached name lookups see status updates."""
+        from crewforge.storage import Database, ProjectStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            project = db.create_project(name="test-project")
+            assert db.get_project_by_name("test-project") is db.get_project_by_name("test-project")
+
+            db.update_project_status(project.id, ProjectStatus.DEVELOPING)
+            assert db.get_project_by_name("test-project").status == ProjectStatus.DEVELOPING
+
+    def test_list_projects_cache_sees_external_writes(self):
+        """Test that another connection's writes invalidate the cached project list."""
+        from crewforge.storage import Database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+            db.create_project(name="first")
+            assert [p.name for p in db.list_projects()] == ["first"]
+
+            other = Database(f"sqlite:///{db_path}")
+            other.create_project(name="second")
+
+            assert [p.name for p in db.list_projects()] == ["first", "second"]
+
+    def test_list_project_summaries(self):
+        """Test the lightweight project listing."""
+        from crewforge.storage import Database, ProjectStatus
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+            db.create_project(name="first", git_repo_path="/tmp/first")
+
+            [row] = db.list_project_summaries()
+            assert (row.name, row.status, row.git_repo_path) == (
+                "first", ProjectStatus.INITIALIZING, "/tmp/first"
+            )
+            assert row.created_at is not None
+
+    def test_cached_response_roundtrip_and_expiry(self):
+        """Test storing, replacing and expiring cached LLM responses."""
+        from crewforge.storage import Database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = Database(f"sqlite:///{db_path}")
+            db.create_tables()
+
+            assert db.get_cached_response("k") is None
+
+            db.set_cached_response("k", "first")
+            db.set_cached_response("k", "second")
+            assert db.get_cached_response("k") == "second"
+
+            db.set_cached_response("expired", "stale", ttl=-1)
+            assert db.get_cached_response("expired") is None
+
+
+class TestLLMConfig:
+    """Tests for LLM model selection."""
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        """Keep provider settings from the host environment out of the tests."""
+        for name in ("OPENAI_BASE_URL", "ANTHROPIC_BASE_URL"):
+            monkeypatch.delenv(name, raising=False)
+
+    def test_model_prefix_per_provider(self):
+        """Test that each provider gets the LiteLLM prefix it expects."""
+        from crewforge.config import AgentRole, LLMConfig
+
+        def models(**kwargs):
+            config = LLMConfig(_env_file=None, **kwargs)
+            return (
+                config.get_model_for_role(AgentRole.ARCHITECT),
+                config.get_model_for_role(AgentRole.DEVELOPER),
+            )
+
+        assert models(provider="openai") == ("gpt-4o", "gpt-4o-mini")
+        assert models(provider="anthropic", strategic_model="s", execution_model="e") == (
+            "anthropic/s",
+            "anthropic/e",
+        )
+        assert models(
+            provider="anthropic", strategic_model="s", ANTHROPIC_BASE_URL="http://proxy"
+        )[0] == "s"
+        assert models(provider="ollama", execution_model="e")[1] == "ollama/e"
+        assert models(
+            provider="openai_compatible",
+            strategic_model="s",
+            openai_compatible_base_url="https://openrouter.ai/api/v1",
+        )[0] == "openrouter/s"
+
+    def test_resolved_model_forces_openai_prefix_for_custom_base_url(self):
+        """Test that OpenAI proxies get an explicit openai/ model prefix."""
+        from crewforge.config import AgentRole, LLMConfig
+
+        config = LLMConfig(_env_file=None, provider="openai", OPENAI_BASE_URL="http://proxy")
+        assert config.get_model_for_role(AgentRole.MANAGER) == "gpt-4o"
+        assert config.resolved_model_for(AgentRole.MANAGER) == "openai/gpt-4o"
+        assert config.resolve_model("claude-x") == "openai/claude-x"
+
+        config = LLMConfig(_env_file=None, provider="openai")
+        assert config.resolved_model_for(AgentRole.MANAGER) == "gpt-4o"
+
+
+    def test_openrouter_api_key_read_from_environment(self, monkeypatch):
+        """Test that OPENROUTER_API_KEY is captured on the config."""
+        from crewforge.config import LLMConfig
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "or-key")
+        assert LLMConfig(_env_file=None).openrouter_api_key == "or-key"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,8 +3,15 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+
+@lru_cache(maxsize=None)
+def _read(path):
+    """读取文件内容（每个文件只读取一次）"""
+    return Path(path).read_text(encoding="utf-8")
+
 def test_openspec_file_structure():
     """测试 OpenSpec 文件结构"""
     print("✓ 测试 OpenSpec 工具文件存在...")
@@ -29,21 +36,19 @@ def test_imports():
 
     import ast
     for file_path in files_to_check:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                ast.parse(f.read())
-                print(f"  ✓ {file_path} 语法正确")
-            except SyntaxError as e:
-                print(f"  ✗ {file_path} 语法错误: {e}")
-                return False
+        try:
+            ast.parse(_read(file_path))
+            print(f"  ✓ {file_path} 语法正确")
+        except SyntaxError as e:
+            print(f"  ✗ {file_path} 语法错误: {e}")
+            return False
     return True
 
 def test_openspec_content():
     """测试 OpenSpec 工具内容"""
     print("\n✓ 测试 OpenSpec 工具类...")
 
-    with open("crewforge/tools/openspec.py", 'r') as f:
-        content = f.read()
+    content = _read("crewforge/tools/openspec.py")
 
     # 检查关键类是否存在
     expected_classes = [
@@ -66,8 +71,7 @@ def test_architect_integration():
     """测试 Architect agent 集成"""
     print("\n✓ 测试 Architect agent OpenSpec 集成...")
 
-    with open("crewforge/core/agents/architect.py", 'r') as f:
-        content = f.read()
+    content = _read("crewforge/core/agents/architect.py")
 
     checks = [
         ("get_openspec_tools", "导入 OpenSpec 工具"),
@@ -89,8 +93,7 @@ def test_developer_integration():
     """测试 Developer agent 集成"""
     print("\n✓ 测试 Developer agent OpenSpec 集成...")
 
-    with open("crewforge/core/agents/developer.py", 'r') as f:
-        content = f.read()
+    content = _read("crewforge/core/agents/developer.py")
 
     checks = [
         ("get_openspec_tools", "导入 OpenSpec 工具"),
@@ -111,8 +114,7 @@ def test_orchestrator_integration():
     """测试 Orchestrator 集成"""
     print("\n✓ 测试 CrewForgeOrchestrator OpenSpec 集成...")
 
-    with open("crewforge/core/crew.py", 'r') as f:
-        content = f.read()
+    content = _read("crewforge/core/crew.py")
 
     checks = [
         ("_read_openspec_context", "OpenSpec 上下文读取方法"),
@@ -134,8 +136,7 @@ def test_settings():
     """测试配置设置"""
     print("\n✓ 测试 OpenSpec 配置...")
 
-    with open("crewforge/config/settings.py", 'r') as f:
-        content = f.read()
+    content = _read("crewforge/config/settings.py")
 
     checks = [
         ("openspec_enabled", "openspec_enabled 配置"),
@@ -156,8 +157,7 @@ def test_cli_chinese():
     """测试 CLI 中文化"""
     print("\n✓ 测试 CLI 中文化...")
 
-    with open("crewforge/cli.py", 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read("crewforge/cli.py")
 
     # 检查一些关键的中文字符串
     chinese_checks = [
@@ -181,8 +181,7 @@ def test_documentation():
     """测试文档更新"""
     print("\n✓ 测试 CLAUDE.md 文档更新...")
 
-    with open("CLAUDE.md", 'r') as f:
-        content = f.read()
+    content = _read("CLAUDE.md")
 
     checks = [
         ("OpenSpec", "OpenSpec 提及"),